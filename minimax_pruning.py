@@ -1,16 +1,28 @@
 import copy
 import math
+import sys
 import time
+from collections import OrderedDict, deque
 from typing import List, Tuple, Optional, Dict, Set
 from enum import Enum
 
+# Transposition table entry flags: what the stored value says about the true score
+TT_EXACT = 0  # The value is the exact score
+TT_LOWER = 1  # The search failed high: the score is at least the value
+TT_UPPER = 2  # The search failed low: the score is at most the value
+
+# The search reads the clock once per 2048 nodes (when nodes & mask == 0), counting
+# main search and quiescence nodes separately
+TIME_CHECK_MASK = 0x7FF
+
 class MinimaxPruning:
     """
     Advanced AI decision-making system using Minimax with Alpha-Beta pruning
     Specifically designed for strategic Ropes & Ladders gameplay
     """
     
-    def __init__(self, max_depth: int = 5, time_limit: float = 3.0, verbose: bool = True):
+    def __init__(self, max_depth: int = 5, time_limit: float = 3.0, verbose: bool = False,
+                 tt_size_bits: int = 18, parallel: bool = False, workers: Optional[int] = None):
         """
         Initialize the AI system
         
@@ -18,17 +30,63 @@ class MinimaxPruning:
             max_depth: Maximum search depth for minimax algorithm
             time_limit: Maximum time allowed for thinking (seconds)
             verbose: Whether to print detailed analysis messages
+            tt_size_bits: Each transposition table tier holds 2**tt_size_bits slots
+            parallel: Whether to search the root moves in worker processes. Sibling
+                rope placements share transposition entries, so scores depend on
+                the order subtrees are searched in and on which table they use;
+                on close positions the parallel search can pick a different move
+                than the sequential one.
+            workers: Number of worker processes (defaults to the CPU count)
         """
         self.max_depth = max_depth
         self.time_limit = time_limit
         self.verbose = verbose
+        self.parallel = parallel
+        self.workers = workers
+        self._executor = None
+        # Bumped by clear_cache(), so worker processes know to clear their tables too
+        self._cache_generation = 0
         self.nodes_evaluated = 0
         self.pruning_count = 0
-        self.transposition_table = {}
+        self.quiescence_nodes = 0
         self.start_time = 0
+        self._timed_out = False
+        self._depth_reached = 0
+        # Event the caller of the search in progress can set to stop it early
+        self._cancel = None
+        
+        # Statistics of the latest get_best_move call, for callers that
+        # benchmark or log searches without verbose output
+        self.last_search_stats = {}
+        
+        # Depth of the root call in progress and the best move found there;
+        # inner nodes only return scores
+        self._root_depth = None
+        self._root_action = None
+        
+        # Killer moves: the last two distinct moves that caused a cutoff at
+        # each remaining depth, tried early in sibling nodes
+        self.killers = [[None, None] for _ in range(self.max_depth + 1)]
+        
+        # Two-tier fixed-size transposition table indexed by the state's Zobrist
+        # hash: a depth-preferred tier that keeps the deepest result per slot and
+        # an always-replace tier that keeps the most recent one.
+        # Each slot holds (zobrist, depth, value, action, flag) or None.
+        self.tt_size = 1 << tt_size_bits
+        self.tt_mask = self.tt_size - 1
+        self.tt_depth_preferred = [None] * self.tt_size
+        self.tt_always_replace = [None] * self.tt_size
+        self.tt_entries = 0
+        
+        # Best first moves for new-game positions, kept across games. Every
+        # ladder layout is a new key, so the least recently used are evicted.
+        self.opening_book = OrderedDict()
+        self.opening_book_max_entries = 256
         
         # Position history for oscillation prevention
-        self.position_history = {}  # player -> list of recent positions
+        self.position_history = {}  # player -> deque of recent positions
+        self._last_visits = {}  # player -> {position: visit number of its latest visit}
+        self._visit_counts = {}  # player -> number of positions recorded so far
         self.max_history_length = 8  # Track last 8 positions
         
         # Strategic weights for evaluation
@@ -41,6 +99,10 @@ class MinimaxPruning:
         self.CENTER_CONTROL_WEIGHT = 2
         self.TURN_PENALTY = 0.1
         self.OSCILLATION_PENALTY = 15  # Penalty for returning to recent positions
+        self.ASPIRATION_WINDOW = 50  # Half-width of the root window around the last iteration's score
+        self.QUIESCENCE_DEPTH = 4     # Maximum rope placements searched past the horizon
+        self.PARALLEL_MIN_MOVES = 4   # Fewest distinct root moves worth searching in parallel
+        self.PARALLEL_POLL_INTERVAL = 0.05  # Seconds between time checks while waiting on workers
         self.PROGRESS_BONUS = 10      # Bonus for making consistent progress
         
         # Game phase and patience parameters
@@ -49,22 +111,67 @@ class MinimaxPruning:
         self.PATIENCE_FACTOR = 0.2    # Reduce rope urgency by 80% in early game
         self.MID_GAME_FACTOR = 0.5    # Reduce rope urgency by 50% in mid game
         
+        # Enum members compared by identity in the hot paths. Imported here
+        # instead of at module level because ropes_ladders_game imports this module.
+        from ropes_ladders_game import ActionType, Player
+        self._action_move = ActionType.MOVE
+        self._action_place_rope = ActionType.PLACE_ROPE_OBSTACLE
+        self._player1 = Player.PLAYER1
+        
+        # Per-ladder evaluation constants for the ladder list they were built from
+        self._ladder_source = None
+        self._ladder_info = ({}, ())
+        
+        # Bitboards of the box spanned by two cells, by (board size, start, end)
+        self._path_boxes = {}
+        
+    def set_verbose(self, verbose: bool):
+        """Switch analysis messages on or off, keeping the cache and statistics"""
+        self.verbose = verbose
+    
+    def reset_stats(self):
+        """Reset the per-search statistics counters"""
+        self.nodes_evaluated = 0
+        self.pruning_count = 0
+        self.quiescence_nodes = 0
+    
     def clear_cache(self):
         """Clear the transposition table for fresh games"""
-        self.transposition_table.clear()
+        self.tt_depth_preferred = [None] * self.tt_size
+        self.tt_always_replace = [None] * self.tt_size
+        self.tt_entries = 0
+        self._cache_generation += 1
         self.position_history.clear()
+        self._last_visits.clear()
+        self._visit_counts.clear()
+    
+    def cache_bytes(self) -> int:
+        """Approximate memory used by the transposition table, in bytes"""
+        total = sys.getsizeof(self.tt_depth_preferred) + sys.getsizeof(self.tt_always_replace)
+        for tier in (self.tt_depth_preferred, self.tt_always_replace):
+            for entry in tier:
+                if entry is not None:
+                    total += sys.getsizeof(entry) + sys.getsizeof(entry[0]) + sys.getsizeof(entry[2])
+        return total
+    
+    def close(self):
+        """Shut down the worker processes used by parallel search"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
     
     def update_position_history(self, player, position):
         """Update position history for oscillation detection"""
         if player not in self.position_history:
-            self.position_history[player] = []
+            # The deque drops positions older than the last max_history_length
+            self.position_history[player] = deque(maxlen=self.max_history_length)
+            self._last_visits[player] = {}
+            self._visit_counts[player] = 0
         
         # Add new position
         self.position_history[player].append(position)
-        
-        # Keep only recent positions
-        if len(self.position_history[player]) > self.max_history_length:
-            self.position_history[player] = self.position_history[player][-self.max_history_length:]
+        self._last_visits[player][position] = self._visit_counts[player]
+        self._visit_counts[player] += 1
     
     def get_game_phase(self, state):
         """
@@ -87,11 +194,10 @@ class MinimaxPruning:
         Returns:
             float: Multiplier for rope urgency (lower = more patient)
         """
-        phase = self.get_game_phase(state)
-        
-        if phase == 'early':
+        # Same turn thresholds as get_game_phase, without building the phase name
+        if state.turn_count <= self.EARLY_GAME_TURNS:
             return self.PATIENCE_FACTOR
-        elif phase == 'mid':
+        elif state.turn_count <= self.MID_GAME_TURNS:
             return self.MID_GAME_FACTOR
         else:
             return 1.0  # Full urgency in late game
@@ -102,19 +208,18 @@ class MinimaxPruning:
             return 0
         
         recent_positions = self.position_history[player]
-        if not recent_positions:
+        last_visit = self._last_visits[player].get(position)
+        if last_visit is None:
             return 0
         
-        penalty = 0
-        # Check how recently this position was visited
-        for i, past_pos in enumerate(reversed(recent_positions)):
-            if past_pos == position:
-                # More recent visits get higher penalties
-                recency_factor = (len(recent_positions) - i) / len(recent_positions)
-                penalty += self.OSCILLATION_PENALTY * recency_factor
-                break
+        # Check how recently this position was visited (0 = latest position)
+        i = self._visit_counts[player] - 1 - last_visit
+        if i >= len(recent_positions):
+            return 0  # Visited too long ago to still be in the history
         
-        return penalty
+        # More recent visits get higher penalties
+        recency_factor = (len(recent_positions) - i) / len(recent_positions)
+        return self.OSCILLATION_PENALTY * recency_factor
     
     def get_progress_evaluation(self, state, player, new_position, old_position):
         """Evaluate if a move represents forward progress"""
@@ -133,47 +238,85 @@ class MinimaxPruning:
         
         return 0
     
-    def get_best_move(self, state, use_iterative_deepening: bool = True):
+    def get_best_move(self, state, use_iterative_deepening: bool = True, cancel=None):
         """
         Get the best move for the current player
         
         Args:
             state: Current game state
             use_iterative_deepening: Whether to use iterative deepening search
+            cancel: Optional threading.Event; setting it (from any thread) makes
+                the search return its best move so far
             
         Returns:
-            Best action dictionary
+            Best action
         """
-        self.nodes_evaluated = 0
-        self.pruning_count = 0
+        self.reset_stats()
+        self.start_time = time.perf_counter()
+        self._timed_out = False
+        self._cancel = cancel
+        self._depth_reached = 0
+        self.killers = [[None, None] for _ in range(self.max_depth + 1)]
         
         if self.verbose:
             print(f"🤖 AI {state.current_player.name} analyzing board...")
         
-        if use_iterative_deepening:
-            best_action = self._iterative_deepening_search(state)
+        # A new game's starting position only depends on the ladder layout, which
+        # the state hash includes, so its search result can be reused directly
+        opening_key = (state.zobrist, state.max_ropes, self.max_depth) if state.turn_count == 0 else None
+        best_action = self.opening_book.get(opening_key) if opening_key else None
+        
+        if best_action is not None:
+            self.opening_book.move_to_end(opening_key)
+            if self.verbose:
+                print(f"   📖 Opening position already analyzed")
         else:
-            self.start_time = time.time()
-            _, best_action = self._minimax(state, self.max_depth, -math.inf, math.inf, True, state.current_player)
+            # The search plays its lines out in place, so it gets its own copy of the
+            # state (an interrupted search can't leave the caller's state mid-line),
+            # with the state's move messages (climbs, rope pushes) silenced
+            search_state = state._clone()
+            search_state.verbose = False
+            if use_iterative_deepening:
+                best_action = self._iterative_deepening_search(search_state)
+            else:
+                _, best_action = self._search_root(search_state, self.max_depth)
+                self._depth_reached = self.max_depth
+        
+        # Only a search that completed every depth gives a result worth replaying
+        if (opening_key and best_action and not self._timed_out
+                and self._depth_reached == self.max_depth):
+            self.opening_book[opening_key] = best_action
+            if len(self.opening_book) > self.opening_book_max_entries:
+                self.opening_book.popitem(last=False)
         
-        search_time = time.time() - self.start_time
+        search_time = time.perf_counter() - self.start_time
+        self.last_search_stats = {
+            'nodes': self.nodes_evaluated,
+            'pruned': self.pruning_count,
+            'quiescence': self.quiescence_nodes,
+            'time': search_time,
+            'depth': self._depth_reached,
+            'cache_entries': self.tt_entries,
+        }
         
         if self.verbose:
             print(f"   📊 Analysis complete: {self.nodes_evaluated} nodes evaluated")
             print(f"   ✂️ Pruning efficiency: {self.pruning_count} branches pruned")
+            print(f"   🌀 Quiescence nodes: {self.quiescence_nodes}")
             print(f"   ⏱️ Search time: {search_time:.2f}s")
-            print(f"   🧠 Cache entries: {len(self.transposition_table)}")
+            print(f"   🧠 Cache entries: {self.tt_entries}")
         
         # Update position history for the current player
-        if best_action and best_action['type'].value == 'move':
-            current_pos = state.player1_pos if state.current_player.name == "PLAYER1" else state.player2_pos
-            new_pos = best_action['position']
+        if best_action and best_action.type is self._action_move:
+            current_pos = state.player1_pos if state.current_player is self._player1 else state.player2_pos
+            new_pos = best_action.position
             self.update_position_history(state.current_player, current_pos)
             
             # Log oscillation prevention info
-            oscillation_penalty = self.get_oscillation_penalty(state.current_player, new_pos)
-            if oscillation_penalty > 0 and self.verbose:
-                print(f"   🚫 Oscillation penalty applied: {oscillation_penalty:.1f}")
+            if self.verbose:
+                oscillation_penalty = self.get_oscillation_penalty(state.current_player, new_pos)
+                if oscillation_penalty > 0:
+                    print(f"   🚫 Oscillation penalty applied: {oscillation_penalty:.1f}")
         
         return best_action if best_action else state.get_possible_actions()[0]
     
@@ -182,110 +325,300 @@ class MinimaxPruning:
         Perform iterative deepening search for better time management
         """
         best_action = None
-        self.start_time = time.time()
+        prev_score = None
+        self.start_time = time.perf_counter()
         
         for depth in range(1, self.max_depth + 1):
-            if time.time() - self.start_time > self.time_limit:
+            self._check_time()
+            if self._timed_out:
                 break
                 
             try:
-                _, action = self._minimax(state, depth, -math.inf, math.inf, True, state.current_player)
+                if prev_score is None:
+                    score, action = self._search_root(state, depth)
+                else:
+                    score, action = self._aspiration_search(state, depth, prev_score)
+                if self._timed_out:
+                    # The time limit cut this iteration short, so its scores are
+                    # unreliable; keep the last completed iteration's move
+                    if best_action is None:
+                        best_action = action
+                    if self.verbose:
+                        print(f"   ⏱️ Depth {depth} cut short by the time limit")
+                    break
+                prev_score = score
                 if action:
                     best_action = action
+                self._depth_reached = depth
                     
                 if self.verbose:
-                    print(f"   🔍 Depth {depth} completed in {time.time() - self.start_time:.2f}s")
+                    print(f"   🔍 Depth {depth} completed in {time.perf_counter() - self.start_time:.2f}s")
+                    pv = self._get_principal_variation(state, depth)
+                    print(f"      PV: {' -> '.join(a.description for a in pv)}")
                 
             except Exception as e:
-                print(f"   ⚠️ Depth {depth} interrupted: {e}")
+                # The last completed iteration's move still stands, but say why the search stopped
+                print(f"   ⚠️ Depth {depth} interrupted: {e!r}")
                 break
         
         return best_action
     
-    def _minimax(self, state, depth: int, alpha: float, beta: float, 
-                maximizing_player: bool, target_player):
+    def _search_root(self, state, depth: int, alpha: float = -math.inf, beta: float = math.inf):
+        """Search the root position to the given depth, in parallel if enabled"""
+        if self.parallel:
+            return self._parallel_root_search(state, depth, alpha, beta)
+        return self._sequential_root_search(state, depth, alpha, beta)
+    
+    def _sequential_root_search(self, state, depth: int, alpha: float, beta: float):
+        """
+        Search the root position in this process
+        
+        Returns:
+            Tuple of (evaluation_score, best_action)
+        """
+        self._root_depth = depth
+        self._root_action = None
+        value = self._negamax(state, depth, alpha, beta, 1, state.current_player)
+        return value, self._root_action
+    
+    def _aspiration_search(self, state, depth: int, prev_score: float):
         """
-        Minimax algorithm with Alpha-Beta pruning
+        Search the root with a narrow window around the previous iteration's score,
+        searching again with the full window when the result falls outside it
+        
+        Returns:
+            Tuple of (evaluation_score, best_action)
+        """
+        alpha = prev_score - self.ASPIRATION_WINDOW
+        beta = prev_score + self.ASPIRATION_WINDOW
+        score, action = self._search_root(state, depth, alpha, beta)
+        if alpha < score < beta:
+            return score, action
+        
+        if self.verbose:
+            if score <= alpha:
+                print(f"   🔻 Fail-low re-search at depth {depth}")
+            else:
+                print(f"   🔺 Fail-high re-search at depth {depth}")
+        return self._search_root(state, depth)
+    
+    def _parallel_root_search(self, state, depth: int, alpha: float, beta: float):
+        """
+        Search the root moves with Young Brothers Wait: the first move in order
+        is searched here to establish alpha, then the remaining moves' subtrees
+        are searched in worker processes with that bound
+        
+        Returns:
+            Tuple of (evaluation_score, best_action)
+        """
+        # Root moves whose children share a transposition key (sibling rope
+        # placements) get a single value in the sequential search, so only the
+        # first of them in move order needs searching
+        state_hash = self._get_state_hash(state)
+        entry = self._probe_tt(state_hash)
+        tt_move = entry[3] if entry is not None else None
+        children = []
+        seen_hashes = set()
+        # Same ordering as the sequential root, killers included, so both pick the same rope
+        for action in self._order_actions(state, state.get_possible_actions(), tt_move,
+                                          self.killers[depth]):
+            try:
+                child = state.apply_action(action)
+            except ValueError:
+                continue
+            child_hash = self._get_state_hash(child)
+            if child_hash not in seen_hashes:
+                seen_hashes.add(child_hash)
+                children.append((action, child))
+        
+        # Too few moves to be worth the process round trips
+        if len(children) < self.PARALLEL_MIN_MOVES:
+            return self._sequential_root_search(state, depth, alpha, beta)
+        
+        if self._executor is None:
+            # Imported here: the process pool machinery roughly doubles the
+            # module's import time and only parallel search needs it
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_search_worker,
+                                                 initargs=(self.max_depth,))
+        
+        alpha_orig = alpha
+        best_action, first_child = children[0]
+        best_value = -self._negamax(first_child, depth - 1, -beta, -alpha, -1, state.current_player)
+        alpha = max(alpha, best_value)
+        
+        if best_value < beta and not self._timed_out:
+            from concurrent.futures import TimeoutError as FutureTimeoutError
+            # Workers get the wall-clock deadline, since perf_counter is per process
+            deadline = time.time() + self.time_limit - (time.perf_counter() - self.start_time)
+            futures = [self._executor.submit(_search_root_child, child, depth - 1, alpha, beta, deadline,
+                                             self.position_history, state.current_player,
+                                             self._cache_generation)
+                       for _, child in children[1:]]
+            for (action, child), future in zip(children[1:], futures):
+                # Keep checking the clock (and stop requests) while the worker runs
+                result = None
+                while result is None and not self._timed_out:
+                    try:
+                        result = future.result(timeout=self.PARALLEL_POLL_INTERVAL)
+                    except FutureTimeoutError:
+                        self._check_time()
+                if result is None:
+                    # Out of time: drop the subtrees no worker has started yet
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                value, child_action, nodes, pruned, quiescence, timed_out = result
+                self.nodes_evaluated += nodes
+                self.pruning_count += pruned
+                self.quiescence_nodes += quiescence
+                if timed_out:
+                    self._timed_out = True
+                else:
+                    # Keep the worker's result, so later iterations and moves start from it
+                    self._store_tt(self._get_state_hash(child), depth - 1, -value, child_action,
+                                   self._bound_flag(-value, -beta, -alpha))
+                if value > best_value:
+                    best_value = value
+                    best_action = action
+        
+        # Scores from a timed-out search are partly static evaluations
+        if not self._timed_out:
+            self._store_tt(state_hash, depth, best_value, best_action,
+                           self._bound_flag(best_value, alpha_orig, beta))
+        return best_value, best_action
+    
+    def _negamax(self, state, depth: int, alpha: float, beta: float, color: int, target_player) -> float:
+        """
+        Negamax form of minimax with Alpha-Beta pruning
         
         Args:
             state: Current game state
             depth: Current search depth
-            alpha: Alpha value for pruning
-            beta: Beta value for pruning
-            maximizing_player: Whether current player is maximizing
+            alpha: Alpha value for pruning, from the side to move's point of view
+            beta: Beta value for pruning, from the side to move's point of view
+            color: 1 if the side to move is target_player, -1 otherwise
             target_player: The player we're optimizing for
             
         Returns:
-            Tuple of (evaluation_score, best_action)
+            Evaluation score from the side to move's point of view
         """
         self.nodes_evaluated += 1
         
-        # Check time limit
-        if time.time() - self.start_time > self.time_limit:
-            return self._evaluate_state(state, target_player), None
+        # Check time limit. Once it has passed, every remaining node returns its
+        # static evaluation so the search unwinds quickly.
+        if not self.nodes_evaluated & TIME_CHECK_MASK:
+            self._check_time()
+        if self._timed_out:
+            return color * self._evaluate_state(state, target_player)
         
         # Check transposition table
         state_hash = self._get_state_hash(state)
-        if state_hash in self.transposition_table:
-            cached_depth, cached_value, cached_action = self.transposition_table[state_hash]
-            if cached_depth >= depth:
-                return cached_value, cached_action
+        entry = self._probe_tt(state_hash)
+        hash_move = None
+        if entry is not None:
+            if entry[1] >= depth:
+                # Bounds only settle the score when they fall outside the window
+                flag = entry[4]
+                if (flag == TT_EXACT or (flag == TT_LOWER and entry[2] >= beta) or
+                        (flag == TT_UPPER and entry[2] <= alpha)):
+                    if depth == self._root_depth:
+                        self._root_action = entry[3]
+                    return entry[2]
+            # Not usable as a score, but its best move still guides ordering
+            hash_move = entry[3]
         
         # Terminal conditions
-        if depth == 0 or state.is_game_over():
-            value = self._evaluate_state(state, target_player)
-            self.transposition_table[state_hash] = (depth, value, None)
-            return value, None
+        if state.is_game_over():
+            value = color * self._evaluate_state(state, target_player)
+            self._store_tt(state_hash, depth, value, None)
+            return value
+        if depth == 0:
+            value = self._quiescence(state, alpha, beta, color, target_player, self.QUIESCENCE_DEPTH)
+            if not self._timed_out:
+                self._store_tt(state_hash, depth, value, None, self._bound_flag(value, alpha, beta))
+            return value
         
         # Get and order actions for better pruning
-        actions = self._order_actions(state, state.get_possible_actions())
+        killers = self.killers[depth]
+        actions = self._order_actions(state, state.get_possible_actions(), hash_move, killers)
+        best_value = -math.inf
         best_action = None
+        # Bind the per-child calls once; this loop is the hottest code in the search.
+        # Children are searched by applying each action to this state and undoing it.
+        apply_inplace = state.apply_inplace
+        undo = state.undo
+        negamax = self._negamax
+        child_depth = depth - 1
+        alpha_orig = alpha
         
-        if maximizing_player:
-            max_eval = -math.inf
+        for action in actions:
+            try:
+                undo_token = apply_inplace(action)
+            except ValueError:
+                continue
+            value = -negamax(state, child_depth, -beta, -alpha, -color, target_player)
+            undo(undo_token)
             
-            for action in actions:
-                try:
-                    new_state = state.apply_action(action)
-                    eval_score, _ = self._minimax(new_state, depth - 1, alpha, beta, False, target_player)
-                    
-                    if eval_score > max_eval:
-                        max_eval = eval_score
-                        best_action = action
-                    
-                    alpha = max(alpha, eval_score)
-                    if beta <= alpha:
+            if value > best_value:
+                best_value = value
+                best_action = action
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
                         self.pruning_count += 1
+                        if action != killers[0]:
+                            killers[1] = killers[0]
+                            killers[0] = action
                         break  # Alpha-Beta pruning
-                        
-                except ValueError:
-                    continue
-            
-            self.transposition_table[state_hash] = (depth, max_eval, best_action)
-            return max_eval, best_action
         
-        else:
-            min_eval = math.inf
-            
-            for action in actions:
-                try:
-                    new_state = state.apply_action(action)
-                    eval_score, _ = self._minimax(new_state, depth - 1, alpha, beta, True, target_player)
-                    
-                    if eval_score < min_eval:
-                        min_eval = eval_score
-                        best_action = action
-                    
-                    beta = min(beta, eval_score)
-                    if beta <= alpha:
-                        self.pruning_count += 1
-                        break  # Alpha-Beta pruning
-                        
-                except ValueError:
-                    continue
+        # Scores below a timed-out node are static evaluations, not search results
+        if not self._timed_out:
+            self._store_tt(state_hash, depth, best_value, best_action,
+                           self._bound_flag(best_value, alpha_orig, beta))
+        if depth == self._root_depth:
+            self._root_action = best_action
+        return best_value
+    
+    def _check_time(self):
+        """Mark the search as timed out once the time limit has passed or the caller cancels it"""
+        if (time.perf_counter() - self.start_time > self.time_limit
+                or (self._cancel is not None and self._cancel.is_set())):
+            self._timed_out = True
+    
+    def _quiescence(self, state, alpha: float, beta: float, color: int,
+                    target_player, depth: int) -> float:
+        """
+        Extend the search past the horizon with tactical rope placements only
+        
+        The side to move may stand pat on the static evaluation or place a rope
+        whose head is on a cell the opponent can step to next, which is the
+        only kind of rope that can push the opponent back on their next move.
+        
+        Returns:
+            Evaluation score from the side to move's point of view
+        """
+        self.quiescence_nodes += 1
+        if not self.quiescence_nodes & TIME_CHECK_MASK:
+            self._check_time()
+        stand_pat = color * self._evaluate_state(state, target_player)
+        if depth == 0 or self._timed_out or state.is_game_over() or stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        
+        best = stand_pat
+        for action in state.get_rope_threat_actions():
+            undo_token = state.apply_inplace(action)
+            score = -self._quiescence(state, -beta, -alpha, -color, target_player, depth - 1)
+            state.undo(undo_token)
             
-            self.transposition_table[state_hash] = (depth, min_eval, best_action)
-            return min_eval, best_action
+            if score > best:
+                best = score
+                alpha = max(alpha, score)
+            if alpha >= beta:
+                self.pruning_count += 1
+                break
+        return best
     
     def _evaluate_state(self, state, player):
         """
@@ -309,19 +642,22 @@ class MinimaxPruning:
                 return 0  # Draw
         
         # Get positions
-        player_pos = state.player1_pos if player.name == "PLAYER1" else state.player2_pos
-        opponent_pos = state.player2_pos if player.name == "PLAYER1" else state.player1_pos
+        is_player1 = player is self._player1
+        player_pos = state.player1_pos if is_player1 else state.player2_pos
+        opponent_pos = state.player2_pos if is_player1 else state.player1_pos
         
         score = 0
         
         # 1. Distance to prize (most important factor)
-        player_distance = state.manhattan_distance(player_pos, state.prize_pos)
-        opponent_distance = state.manhattan_distance(opponent_pos, state.prize_pos)
+        prize_row, prize_col = state.prize_pos
+        player_distance = abs(player_pos[0] - prize_row) + abs(player_pos[1] - prize_col)
+        opponent_distance = abs(opponent_pos[0] - prize_row) + abs(opponent_pos[1] - prize_col)
         distance_score = (opponent_distance - player_distance) * self.DISTANCE_WEIGHT
         score += distance_score
         
         # 2. Ladder strategic evaluation
-        ladder_score = self._evaluate_ladders(state, player, player_pos, opponent_pos)
+        ladder_score = self._evaluate_ladders(state, player_pos, opponent_pos,
+                                              player_distance, opponent_distance)
         score += ladder_score
         
         # 3. Rope strategic evaluation
@@ -356,38 +692,60 @@ class MinimaxPruning:
         
         return score
     
-    def _evaluate_ladders(self, state, player, player_pos, opponent_pos):
+    def _evaluate_ladders(self, state, player_pos, opponent_pos, player_distance, opponent_distance):
         """Evaluate ladder positions and opportunities"""
-        if not hasattr(state, 'ladders'):
-            return 0
-        
         ladder_score = 0
+        ladders_by_start, beneficial_bases = self._get_ladder_info(state)
         
-        for start_pos, end_pos in state.ladders:
-            # Bonus if player is on a ladder base
-            if player_pos == start_pos:
-                ladder_advance = state.manhattan_distance(player_pos, state.prize_pos) - state.manhattan_distance(end_pos, state.prize_pos)
-                if ladder_advance > 0:  # Ladder brings us closer to prize
-                    ladder_score += ladder_advance * self.LADDER_WEIGHT
-                else:
-                    ladder_score += 5  # Small bonus even if not optimal
-            
-            # Penalty if opponent is on a ladder base
-            if opponent_pos == start_pos:
-                ladder_advance = state.manhattan_distance(opponent_pos, state.prize_pos) - state.manhattan_distance(end_pos, state.prize_pos)
-                if ladder_advance > 0:
-                    ladder_score -= ladder_advance * self.LADDER_WEIGHT
-                else:
-                    ladder_score -= 5
-            
-            # Bonus for being close to beneficial ladder bases
-            if state.manhattan_distance(end_pos, state.prize_pos) < state.manhattan_distance(start_pos, state.prize_pos):
-                distance_to_ladder = state.manhattan_distance(player_pos, start_pos)
-                if distance_to_ladder <= 3:  # Within striking distance
-                    ladder_score += (4 - distance_to_ladder) * 3
+        # Bonus if player is on a ladder base
+        end_distance = ladders_by_start.get(player_pos)
+        if end_distance is not None:
+            ladder_advance = player_distance - end_distance
+            if ladder_advance > 0:  # Ladder brings us closer to prize
+                ladder_score += ladder_advance * self.LADDER_WEIGHT
+            else:
+                ladder_score += 5  # Small bonus even if not optimal
+        
+        # Penalty if opponent is on a ladder base
+        end_distance = ladders_by_start.get(opponent_pos)
+        if end_distance is not None:
+            ladder_advance = opponent_distance - end_distance
+            if ladder_advance > 0:
+                ladder_score -= ladder_advance * self.LADDER_WEIGHT
+            else:
+                ladder_score -= 5
+        
+        # Bonus for being close to beneficial ladder bases
+        player_row, player_col = player_pos
+        for start_row, start_col in beneficial_bases:
+            distance_to_ladder = abs(player_row - start_row) + abs(player_col - start_col)
+            if distance_to_ladder <= 3:  # Within striking distance
+                ladder_score += (4 - distance_to_ladder) * 3
         
         return ladder_score
     
+    def _get_ladder_info(self, state):
+        """
+        Get the state's ladders as ({base: top_to_prize_distance}, bases of the
+        ladders that lead toward the prize)
+        
+        Ladders never change during a game, so the tables are rebuilt only when
+        the state's ladder list is a different one from the last call.
+        """
+        if state.ladders is not self._ladder_source:
+            prize_row, prize_col = state.prize_pos
+            ladders_by_start = {}
+            beneficial_bases = []
+            for start_pos, end_pos in state.ladders:
+                start_distance = abs(start_pos[0] - prize_row) + abs(start_pos[1] - prize_col)
+                end_distance = abs(end_pos[0] - prize_row) + abs(end_pos[1] - prize_col)
+                ladders_by_start[start_pos] = end_distance
+                if end_distance < start_distance:
+                    beneficial_bases.append(start_pos)
+            self._ladder_source = state.ladders
+            self._ladder_info = (ladders_by_start, tuple(beneficial_bases))
+        return self._ladder_info
+    
     def _evaluate_ropes(self, state, player, player_pos, opponent_pos):
         """Evaluate rope obstacles and their strategic value"""
         rope_score = 0
@@ -400,7 +758,7 @@ class MinimaxPruning:
                 # Our rope - evaluate its effectiveness
                 if not used:
                     # Unused rope - evaluate potential
-                    opponent_to_head = state.manhattan_distance(opponent_pos, rope_head)
+                    opponent_to_head = abs(opponent_pos[0] - rope_head[0]) + abs(opponent_pos[1] - rope_head[1])
                     if opponent_to_head <= 2:  # Opponent is close to rope head
                         rope_score += self.ROPE_STRATEGIC_WEIGHT
                     
@@ -413,7 +771,7 @@ class MinimaxPruning:
             else:
                 # Opponent's rope - evaluate threat
                 if not used:
-                    player_to_head = state.manhattan_distance(player_pos, rope_head)
+                    player_to_head = abs(player_pos[0] - rope_head[0]) + abs(player_pos[1] - rope_head[1])
                     if player_to_head <= 2:  # We're close to opponent's rope head
                         rope_score -= self.ROPE_STRATEGIC_WEIGHT
                     
@@ -425,7 +783,7 @@ class MinimaxPruning:
     
     def _evaluate_rope_urgency(self, state, player, opponent_distance):
         """Evaluate urgency of using remaining ropes with game phase awareness"""
-        player_ropes = state.player1_rope_obstacles if player.name == "PLAYER1" else state.player2_rope_obstacles
+        player_ropes = state.player1_rope_obstacles if player is self._player1 else state.player2_rope_obstacles
         
         # Get patience multiplier based on game phase
         patience_multiplier = self.get_patience_multiplier(state)
@@ -468,62 +826,127 @@ class MinimaxPruning:
         """Check if rope blocks direct path between two positions"""
         start_row, start_col = start_pos
         end_row, end_col = end_pos
+        row_lo, row_hi = (start_row, end_row) if start_row <= end_row else (end_row, start_row)
+        col_lo, col_hi = (start_col, end_col) if start_col <= end_col else (end_col, start_col)
+        
+        # Ropes are straight, so the head and tail span the rope's bounding box;
+        # most ropes lie wholly outside the path's box and need no per-cell check
+        (head_row, head_col), (tail_row, tail_col) = rope_cells[0], rope_cells[-1]
+        if ((head_row < row_lo and tail_row < row_lo) or (head_row > row_hi and tail_row > row_hi) or
+                (head_col < col_lo and tail_col < col_lo) or (head_col > col_hi and tail_col > col_hi)):
+            return False
         
         # Check if any rope cell is in the direct path
         for rope_row, rope_col in rope_cells:
             # Simple check: is rope cell between start and end?
-            if (min(start_row, end_row) <= rope_row <= max(start_row, end_row) and
-                min(start_col, end_col) <= rope_col <= max(start_col, end_col)):
+            if row_lo <= rope_row <= row_hi and col_lo <= rope_col <= col_hi:
                 return True
         
         return False
     
-    def _order_actions(self, state, actions):
-        """Order actions for better alpha-beta pruning"""
+    def _path_box_mask(self, board_size, start_pos, end_pos):
+        """Bitboard of the cells in the box spanned by two positions (see _rope_blocks_path)"""
+        key = (board_size, start_pos, end_pos)
+        mask = self._path_boxes.get(key)
+        if mask is None:
+            row_lo, row_hi = sorted((start_pos[0], end_pos[0]))
+            col_lo, col_hi = sorted((start_pos[1], end_pos[1]))
+            row_bits = ((1 << (col_hi - col_lo + 1)) - 1) << col_lo
+            mask = 0
+            for row in range(row_lo, row_hi + 1):
+                mask |= row_bits << (row * board_size)
+            self._path_boxes[key] = mask
+        return mask
+    
+    def _order_actions(self, state, actions, tt_move=None, killers=()):
+        """
+        Order actions for better alpha-beta pruning
+        
+        Actions are yielded lazily: the rest are only scored and sorted once the
+        leading moves have been searched without a cutoff, so the state must be
+        back as it was whenever the next action is requested.
+        
+        Args:
+            state: Current game state
+            actions: Candidate actions for the current player
+            tt_move: Best move stored in the transposition table, tried first
+            killers: Killer moves for this depth, tried right after tt_move
+        """
+        # The table's best move (the previous iteration's principal variation)
+        # and the moves that caused cutoffs in sibling nodes are the most likely
+        # to cause a cutoff here, so they go first and skip the scoring
+        leading = []
+        for move in (tt_move, *killers):
+            if move is not None and move not in leading and move in actions:
+                leading.append(move)
+        yield from leading
+        
+        # Terms that only depend on the state are computed once for the whole
+        # batch of candidate actions rather than once per action
+        action_move = self._action_move
+        action_place_rope = self._action_place_rope
+        current_player = state.current_player
+        prize_pos = state.prize_pos
+        current_pos = state.get_current_player_position()
+        opponent_pos = state.get_opponent_position()
+        opponent_row, opponent_col = opponent_pos
+        prize_row, prize_col = prize_pos
+        
+        # Get current player's remaining ropes
+        player_ropes = state.player1_rope_obstacles if current_player is self._player1 else state.player2_rope_obstacles
+        current_row, current_col = current_pos
+        opponent_to_prize = abs(opponent_row - prize_row) + abs(opponent_col - prize_col)
+        urgent_defense = opponent_to_prize <= 3  # Opponent is 3 or fewer moves from winning
+        # A rope blocks the opponent's path when it covers a cell of this box
+        opponent_path = self._path_box_mask(state.board_size, opponent_pos, prize_pos)
+        
+        # Game phase patience penalty (makes rope placement less attractive in early game)
+        # BUT: ignore patience when opponent is about to win!
+        patience_penalty = 0
+        if not urgent_defense:  # Only apply patience when not urgent
+            game_phase = self.get_game_phase(state)
+            if game_phase == 'early':
+                patience_penalty = 30  # Higher penalty in early game
+            elif game_phase == 'mid':
+                patience_penalty = 15  # Medium penalty in mid game
+        
+        # Rope conservation penalty (discourage using all ropes at once)
+        conservation_penalty = 0
+        if player_ropes > 1:  # If we have multiple ropes left
+            # Encourage saving at least one rope for later
+            conservation_penalty = (player_ropes - 1) * 8
+        
         def action_priority(action):
-            # Import ActionType locally to avoid circular imports
-            from ropes_ladders_game import ActionType
-            
-            if action['type'] == ActionType.MOVE:
+            action_type = action.type
+            if action_type == action_move:
                 # Prioritize moves that get closer to prize
-                distance = state.manhattan_distance(action['position'], state.prize_pos)
+                move_row, move_col = action.position
+                distance = abs(move_row - prize_row) + abs(move_col - prize_col)
                 
                 # Add oscillation penalty to move ordering
-                oscillation_penalty = self.get_oscillation_penalty(state.current_player, action['position'])
+                oscillation_penalty = self.get_oscillation_penalty(current_player, action.position)
                 
                 # Add progress evaluation
-                current_pos = state.get_current_player_position()
-                progress_bonus = -self.get_progress_evaluation(state, state.current_player, action['position'], current_pos)
+                progress_bonus = -self.get_progress_evaluation(state, current_player, action.position, current_pos)
                 
                 # Combine factors (lower score = higher priority)
                 total_score = distance + (oscillation_penalty * 0.1) + (progress_bonus * 0.1)
                 return total_score
             
-            elif action['type'] == ActionType.PLACE_ROPE_OBSTACLE:
+            elif action_type == action_place_rope:
                 # Prioritize rope placement based on strategic value and game phase
-                cells = action['segment']
-                head = cells[0]
-                tail = cells[-1]
-                opponent_pos = state.get_opponent_position()
-                current_pos = state.get_current_player_position()
-                
-                # Get current player's remaining ropes
-                player_ropes = state.player1_rope_obstacles if state.current_player.name == "PLAYER1" else state.player2_rope_obstacles
+                cells = action.segment
+                head_row, head_col = cells[0]
+                tail_row, tail_col = cells[-1]
                 
                 # Distance from opponent to rope head
-                rope_to_opponent = state.manhattan_distance(head, opponent_pos)
-                opponent_to_prize = state.manhattan_distance(opponent_pos, state.prize_pos)
+                rope_to_opponent = abs(head_row - opponent_row) + abs(head_col - opponent_col)
                 
                 # URGENT DEFENSIVE MODE: If opponent is very close to winning
                 urgent_defense_bonus = 0
-                if opponent_to_prize <= 3:  # Opponent is 3 or fewer moves from winning
+                if urgent_defense:
                     # Prioritize ropes exactly 1 cell ahead of opponent toward prize
                     if rope_to_opponent == 1:
-                        # Check if rope is in opponent's direction toward prize
-                        opponent_row, opponent_col = opponent_pos
-                        prize_row, prize_col = state.prize_pos
-                        head_row, head_col = head
-                        
                         # Is rope head between opponent and prize?
                         if ((opponent_row > prize_row and head_row < opponent_row) or  # Opponent moving up
                             (opponent_row < prize_row and head_row > opponent_row) or  # Opponent moving down
@@ -542,44 +965,24 @@ class MinimaxPruning:
                         distance_bonus = 15  # Too far, likely irrelevant
                 
                 # Distance from rope to prize (ropes closer to prize are more blocking)
-                rope_to_prize = min(
-                    state.manhattan_distance(head, state.prize_pos),
-                    state.manhattan_distance(tail, state.prize_pos)
-                )
+                rope_head_to_prize = abs(head_row - prize_row) + abs(head_col - prize_col)
+                rope_to_prize = min(rope_head_to_prize, abs(tail_row - prize_row) + abs(tail_col - prize_col))
                 
                 # Bonus for ropes that block opponent's path to prize
                 path_blocking_bonus = 0
-                if self._rope_blocks_path(state, cells, opponent_pos, state.prize_pos):
+                if action.mask & opponent_path:
                     path_blocking_bonus = -15  # Negative because lower is better priority
                 
                 # Penalty for ropes too close to current player (likely ineffective)
                 self_distance_penalty = 0
-                current_to_head = state.manhattan_distance(current_pos, head)
+                current_to_head = abs(current_row - head_row) + abs(current_col - head_col)
                 if current_to_head <= 1:
                     self_distance_penalty = 20  # High penalty for placing rope next to self
                 
-                # Game phase patience penalty (makes rope placement less attractive in early game)
-                # BUT: ignore patience when opponent is about to win!
-                patience_penalty = 0
-                if opponent_to_prize > 3:  # Only apply patience when not urgent
-                    game_phase = self.get_game_phase(state)
-                    if game_phase == 'early':
-                        patience_penalty = 30  # Higher penalty in early game
-                    elif game_phase == 'mid':
-                        patience_penalty = 15  # Medium penalty in mid game
-                
-                # Rope conservation penalty (discourage using all ropes at once)
-                conservation_penalty = 0
-                if player_ropes > 1:  # If we have multiple ropes left
-                    # Encourage saving at least one rope for later
-                    conservation_penalty = (player_ropes - 1) * 8
-                
                 # Priority toward opponent's likely movement direction
                 direction_bonus = 0
                 if rope_to_opponent <= 3:  # Only consider if rope is reasonably close
-                    opponent_to_prize = state.manhattan_distance(opponent_pos, state.prize_pos)
-                    rope_to_prize_from_opponent = state.manhattan_distance(head, state.prize_pos)
-                    if rope_to_prize_from_opponent < opponent_to_prize:
+                    if rope_head_to_prize < opponent_to_prize:
                         direction_bonus = -8  # Rope is between opponent and prize
                 
                 return (rope_to_opponent + distance_bonus + urgent_defense_bonus + rope_to_prize * 0.3 + 
@@ -588,14 +991,116 @@ class MinimaxPruning:
             
             return 50  # Default priority
         
-        return sorted(actions, key=action_priority)
+        rest = [action for action in actions if action not in leading] if leading else actions
+        yield from sorted(rest, key=action_priority)
+    
+    def _get_principal_variation(self, state, depth: int):
+        """Follow the best moves stored in the transposition table from state"""
+        pv = []
+        undo_tokens = []
+        for _ in range(depth):
+            entry = self._probe_tt(self._get_state_hash(state))
+            if entry is None or entry[3] is None:
+                break
+            try:
+                undo_tokens.append(state.apply_inplace(entry[3]))
+            except ValueError:
+                break
+            pv.append(entry[3])
+        for undo_token in reversed(undo_tokens):
+            state.undo(undo_token)
+        return pv
+    
+    def _probe_tt(self, state_hash):
+        """Get the deepest transposition table entry for this hash, or None"""
+        index = state_hash & self.tt_mask
+        entry = self.tt_depth_preferred[index]
+        if entry is not None and entry[0] == state_hash:
+            return entry
+        entry = self.tt_always_replace[index]
+        if entry is not None and entry[0] == state_hash:
+            return entry
+        return None
+    
+    def _bound_flag(self, value, alpha, beta):
+        """Get the entry flag for a value searched with the window (alpha, beta)"""
+        if value <= alpha:
+            return TT_UPPER
+        if value >= beta:
+            return TT_LOWER
+        return TT_EXACT
+    
+    def _store_tt(self, state_hash, depth, value, action, flag=TT_EXACT):
+        """
+        Store a search result in the transposition table slot for this hash
+        
+        Results at least as deep as the depth-preferred entry take its place and
+        the entry it held moves to the always-replace tier; shallower results
+        go straight to the always-replace tier.
+        """
+        index = state_hash & self.tt_mask
+        new_entry = (state_hash, depth, value, action, flag)
+        preferred = self.tt_depth_preferred[index]
+        if preferred is None:
+            self.tt_entries += 1
+            self.tt_depth_preferred[index] = new_entry
+            return
+        if depth >= preferred[1]:
+            self.tt_depth_preferred[index] = new_entry
+            if preferred[0] == state_hash:
+                return
+            new_entry = preferred
+        if self.tt_always_replace[index] is None:
+            self.tt_entries += 1
+        self.tt_always_replace[index] = new_entry
     
     def _get_state_hash(self, state):
-        """Generate a unique hash for the game state (for transposition table)"""
-        # Create a simple hash based on key state components
-        return (f"{state.player1_pos}_{state.player2_pos}_{state.player1_rope_obstacles}_"
-                f"{state.player2_rope_obstacles}_{state.current_player.name}_{state.turn_count}_"
-                f"{len(state.rope_obstacles)}_{state.game_phase.name}")
+        """Get the hash of the game state (for transposition table)"""
+        # The game state keeps its Zobrist hash up to date on every change.
+        # Individual rope segments are left out of the key (only the rope counts
+        # remain), so sibling rope placements share an entry and the segment
+        # choice is left to _order_actions.
+        return state.zobrist ^ state.rope_zobrist
+
+
+# Agent of a parallel search worker process, kept between the subtrees it searches,
+# and the parent's cache generation its transposition table belongs to
+_worker_ai = None
+_worker_generation = 0
+
 
+def _init_search_worker(max_depth: int):
+    """Create the worker process's agent when the process pool starts it"""
+    global _worker_ai
+    _worker_ai = MinimaxPruning(max_depth=max_depth, verbose=False, tt_size_bits=16)
 
- 
\ No newline at end of file
+
+def _search_root_child(state, depth: int, alpha: float, beta: float, deadline: float,
+                       position_history, target_player, cache_generation: int):
+    """
+    Worker for parallel root search: minimax one root child with the process's agent
+    
+    Returns:
+        Tuple of (evaluation_score, child_best_action, nodes_evaluated, pruning_count,
+        quiescence_nodes, timed_out)
+    """
+    global _worker_generation
+    ai = _worker_ai
+    ai.reset_stats()
+    if cache_generation != _worker_generation:
+        _worker_generation = cache_generation
+        ai.clear_cache()
+    else:
+        ai.position_history.clear()
+        ai._last_visits.clear()
+        ai._visit_counts.clear()
+    for player, positions in position_history.items():
+        for position in positions:
+            ai.update_position_history(player, position)
+    ai.time_limit = deadline - time.time()
+    ai.start_time = time.perf_counter()
+    ai._timed_out = False
+    value = -ai._negamax(state, depth, -beta, -alpha, -1, target_player)
+    entry = ai._probe_tt(ai._get_state_hash(state))
+    child_action = entry[3] if entry is not None else None
+    return value, child_action, ai.nodes_evaluated, ai.pruning_count, ai.quiescence_nodes, ai._timed_out
@@ -1,8 +1,8 @@
-import copy
 import math
 import random
 import time
-from typing import List, Tuple, Optional, Dict, Set
+from collections import namedtuple
+from typing import List, Tuple, Optional, Dict, Set, Union
 from enum import Enum
 
 class Player(Enum):
@@ -28,9 +28,144 @@ class Direction(Enum):
     LEFT = (0, -1)
     RIGHT = (0, 1)
 
+# Enum members bound to module names for the hot paths: looking a member up on
+# its Enum class, or reading .value, costs several times an identity test
+_PLAYER1 = Player.PLAYER1
+_PLAYER2 = Player.PLAYER2
+_MOVE = ActionType.MOVE
+_PLACE_ROPE = ActionType.PLACE_ROPE_OBSTACLE
+_PLAYING = GamePhase.PLAYING
+
+# Zobrist key tables, built lazily per board size (see _zobrist_keys)
+_ZOBRIST_TABLES = {}
+_ZOBRIST_TURN = []
+_ZOBRIST_TURN_RNG = random.Random(0)
+
+def _zobrist_keys(board_size: int) -> Dict[str, List]:
+    """Get the Zobrist key tables for a board size, building them on first use"""
+    keys = _ZOBRIST_TABLES.get(board_size)
+    if keys is None:
+        # Dedicated generator so hashing never disturbs the global random state
+        rng = random.Random(board_size)
+        cells = board_size * board_size
+        keys = {
+            'player': [[rng.getrandbits(64) for _ in range(cells)] for _ in range(2)],
+            # Ropes are keyed by (owner, used, head cell, direction)
+            'rope': [[[rng.getrandbits(64) for _ in range(cells * 3)] for _ in range(2)] for _ in range(2)],
+            # Ropes placed per player (own ropes never overlap, so this stays below cells)
+            'ropes_placed': [[rng.getrandbits(64) for _ in range(cells)] for _ in range(2)],
+            # Ladder layout keys (base, top) so different boards never share hashes
+            'ladder': [[rng.getrandbits(64) for _ in range(cells)] for _ in range(2)],
+            'side': rng.getrandbits(64),
+        }
+        _ZOBRIST_TABLES[board_size] = keys
+    return keys
+
+def _zobrist_turn(turn: int) -> int:
+    """Get the Zobrist key for a turn number, extending the table as needed"""
+    while len(_ZOBRIST_TURN) <= turn:
+        _ZOBRIST_TURN.append(_ZOBRIST_TURN_RNG.getrandbits(64))
+    return _ZOBRIST_TURN[turn]
+
+# In-bounds step destinations for every cell, one table per board size
+_LANDINGS = {}
+
+def _landing_table(board_size: int) -> Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]:
+    """Get the in-bounds destinations of a step from each cell (in Direction order)"""
+    table = _LANDINGS.get(board_size)
+    if table is None:
+        table = {}
+        for row in range(board_size):
+            for col in range(board_size):
+                table[(row, col)] = tuple(
+                    (row + d_row, col + d_col) for d_row, d_col in (d.value for d in Direction)
+                    if 0 <= row + d_row < board_size and 0 <= col + d_col < board_size)
+        _LANDINGS[board_size] = table
+    return table
+
+# Ladder candidates, one list per board size (see _ladder_candidates)
+_LADDER_CANDIDATES = {}
+
+def _ladder_candidates(board_size: int) -> List[Tuple[Tuple[int, int], Tuple[int, int], Tuple[Tuple[int, int], ...]]]:
+    """Get every ladder random placement may pick as (base, top, cells), building them on first use"""
+    candidates = _LADDER_CANDIDATES.get(board_size)
+    if candidates is None:
+        candidates = []
+        for length in range(2, 5):
+            # Ladders run straight up, up-right or up-left from their base
+            for d_row, d_col in ((1, 0), (1, 1), (1, -1)):
+                for start_row in range(board_size - length):
+                    for start_col in range(board_size):
+                        # For diagonals, ensure col stays in bounds
+                        if d_col == 1 and start_col > board_size - length - 1:
+                            continue
+                        if d_col == -1 and start_col < length:
+                            continue
+                        cells = tuple((start_row + d_row * i, start_col + d_col * i) for i in range(length))
+                        # The base is the bottom-most cell, the top the top-most one
+                        candidates.append((cells[-1], cells[0], cells))
+        _LADDER_CANDIDATES[board_size] = candidates
+    return candidates
+
+# Rope placement directions, in the order actions are generated
+ROPE_DIRECTIONS = {
+    'down': (1, 0),
+    'diagonal_right': (1, 1),
+    'diagonal_left': (1, -1)
+}
+
+# Actions players can take; fields are read as attributes (action.type).
+# cell is the position packed as row * board_size + col; mask is the bitboard of
+# the rope's cells and key_index its slot in the Zobrist rope keys.
+Move = namedtuple('Move', 'type position description cell')
+PlaceRope = namedtuple('PlaceRope', 'type segment direction description mask key_index')
+Action = Union[Move, PlaceRope]
+
+# Prebuilt actions, one table per board size (see _action_table)
+_ACTION_TABLES = {}
+
+def _action_table(board_size: int) -> Dict[str, List]:
+    """
+    Get the prebuilt actions for a board size, building them on first use
+    
+    Actions are shared between all states of that size, so the search does not
+    allocate an action (and format its description) for every candidate at every node.
+    """
+    table = _ACTION_TABLES.get(board_size)
+    if table is None:
+        moves = {}
+        ropes = []  # In-bounds rope segments in generation order
+        rope_masks = []  # Bitboard of each rope segment's cells (bit row * board_size + col)
+        rope_by_head = {}  # Head cell -> [(action, mask)] for the segments starting there
+        for row in range(board_size):
+            for col in range(board_size):
+                pos = (row, col)
+                cell = row * board_size + col
+                moves[pos] = Move(ActionType.MOVE, pos, f"Move to {pos}", cell)
+                for dir_name, (dr, dc) in ROPE_DIRECTIONS.items():
+                    cells = tuple((row + dr * i, col + dc * i) for i in range(3))
+                    if all(0 <= r < board_size and 0 <= c < board_size for r, c in cells):
+                        mask = sum(1 << (r * board_size + c) for r, c in cells)
+                        ropes.append(PlaceRope(ActionType.PLACE_ROPE_OBSTACLE, cells, dir_name,
+                                               f"Place rope {dir_name.upper()} from {pos}",
+                                               mask, cell * 3 + dc % 3))
+                        rope_masks.append(mask)
+                        rope_by_head.setdefault(pos, []).append((ropes[-1], mask))
+        table = {'move': moves, 'rope': ropes, 'rope_masks': rope_masks, 'rope_by_head': rope_by_head}
+        _ACTION_TABLES[board_size] = table
+    return table
+
 class GameState:
     """Represents the complete state of the game at any point"""
     
+    # Fixed attribute layout: the AI creates a state per searched node
+    __slots__ = ('board_size', 'max_ropes', 'verbose',
+                 'player1_pos', 'player2_pos', 'prize_pos',
+                 'player1_ropes', 'player2_ropes',
+                 'player1_rope_obstacles', 'player2_rope_obstacles', 'rope_obstacles',
+                 'walls', 'ladders', '_ladder_tops', 'current_player', 'turn_count', 'game_phase',
+                 'rope_bitboards', 'rope_zobrist', 'zobrist', 'winner', '_keys')
+    
     def __init__(self, board_size: int = 11, max_ropes: int = 3, verbose: bool = True):
         self.board_size = board_size
         self.max_ropes = max_ropes
@@ -48,19 +183,34 @@ class GameState:
         # Initialize rope obstacles (placed during setup)
         self.player1_rope_obstacles = max_ropes
         self.player2_rope_obstacles = max_ropes
-        self.rope_obstacles = []  # List of (cells, player, used)
+        # List of (cells, player, used). Both rope lists are replaced rather than
+        # mutated when a rope changes, so undo tokens can keep references to them.
+        self.rope_obstacles = []
+        # Bitboard of the cells covered by each player's ropes (bit row * board_size + col)
+        self.rope_bitboards = [0, 0]
         
-        # Initialize walls (can be added dynamically)
-        self.walls = set()
+        # Initialize walls (fixed for the whole game, so states share the set)
+        self.walls = frozenset()
         
-        # Initialize ladders (placed during setup)
+        # Initialize ladders (placed during setup, then frozen so states share them)
         self.ladders = []  # List of (start_pos, end_pos)
         self._place_random_ladders()
+        self.ladders = tuple(self.ladders)
+        self._ladder_tops = {}  # Ladder base -> top, for climbing
+        for start_pos, end_pos in self.ladders:
+            self._ladder_tops.setdefault(start_pos, end_pos)
         
         # Game state
         self.current_player = Player.PLAYER1
         self.turn_count = 0
         self.game_phase = GamePhase.PLAYING
+        self.winner = None
+        
+        # Incrementally maintained Zobrist hash of the state. rope_zobrist is the
+        # part of it contributed by the individual rope obstacles.
+        self._keys = _zobrist_keys(board_size)
+        self.rope_zobrist = self._compute_rope_zobrist()
+        self.zobrist = self._compute_zobrist()
         
         if self.verbose:
             print(f"Game initialized:")
@@ -71,16 +221,52 @@ class GameState:
             print(f"   Each player has {max_ropes} rope obstacles to place during the game")
             print(f"   Game starts immediately - no setup phase!")
     
-    def get_state_hash(self) -> str:
+    def get_state_hash(self) -> int:
         """Generate a unique hash for this game state for transposition table"""
-        def rope_str(r):
-            cells = r[0]
-            player = r[1]
-            used = r[2]
-            cell_str = ",".join([f"{c[0]}_{c[1]}" for c in cells])
-            return f"{cell_str}-{player.value}-{used}"
-        rope_obstacles_str = "_".join(sorted([rope_str(r) for r in self.rope_obstacles]))
-        return f"{self.player1_pos}_{self.player2_pos}_{self.player1_ropes}_{self.player2_ropes}_{self.current_player.value}_{self.turn_count}_{rope_obstacles_str}_{self.game_phase.value}"
+        # Kept up to date incrementally by every method that changes the state
+        return self.zobrist
+    
+    def _compute_zobrist(self) -> int:
+        """Compute the Zobrist hash of this state from scratch"""
+        keys = self._keys
+        n = self.board_size
+        h = keys['player'][0][self.player1_pos[0] * n + self.player1_pos[1]]
+        h ^= keys['player'][1][self.player2_pos[0] * n + self.player2_pos[1]]
+        h ^= keys['ropes_placed'][0][self.max_ropes - self.player1_rope_obstacles]
+        h ^= keys['ropes_placed'][1][self.max_ropes - self.player2_rope_obstacles]
+        h ^= self._compute_rope_zobrist()
+        for start_pos, end_pos in self.ladders:
+            h ^= keys['ladder'][0][start_pos[0] * n + start_pos[1]] ^ keys['ladder'][1][end_pos[0] * n + end_pos[1]]
+        if self.current_player is _PLAYER2:
+            h ^= keys['side']
+        return h ^ _zobrist_turn(self.turn_count)
+    
+    def _compute_rope_zobrist(self) -> int:
+        """Compute the rope obstacles' share of the Zobrist hash from scratch"""
+        h = 0
+        for cells, player, used in self.rope_obstacles:
+            h ^= self._rope_key(cells, player, used)
+        return h
+    
+    def _rope_key(self, cells, player: Player, used: bool) -> int:
+        """Zobrist key of a single rope obstacle"""
+        head = cells[0]
+        direction = (cells[1][1] - head[1]) % 3
+        cell = head[0] * self.board_size + head[1]
+        side = 0 if player is _PLAYER1 else 1
+        return self._keys['rope'][side][used][cell * 3 + direction]
+    
+    def _set_player_pos(self, player: Player, pos: Tuple[int, int], cell: int):
+        """Move a player's piece to pos (packed as cell), keeping the Zobrist hash in sync"""
+        keys = self._keys['player'][0 if player is _PLAYER1 else 1]
+        n = self.board_size
+        if player is _PLAYER1:
+            old = self.player1_pos
+            self.player1_pos = pos
+        else:
+            old = self.player2_pos
+            self.player2_pos = pos
+        self.zobrist ^= keys[old[0] * n + old[1]] ^ keys[cell]
     
     def is_valid_position(self, pos: Tuple[int, int]) -> bool:
         """Check if position is within board bounds and not blocked by walls"""
@@ -91,36 +277,39 @@ class GameState:
     
     def is_on_rope_obstacle(self, pos: Tuple[int, int]) -> bool:
         """Check if position is on a rope obstacle (any of the 3 cells)"""
-        for cells, player, used in self.rope_obstacles:
-            if pos in cells:
-                return True
-        return False
+        row, col = pos
+        if not (0 <= row < self.board_size and 0 <= col < self.board_size):
+            return False
+        return bool((self.rope_bitboards[0] | self.rope_bitboards[1]) >> (row * self.board_size + col) & 1)
     
     def get_rope_obstacle_positions(self) -> Set[Tuple[int, int]]:
         """Get all positions that are part of rope obstacles (all 3 cells)"""
         positions = set()
-        for cells, player, used in self.rope_obstacles:
-            positions.update(cells)
+        mask = self.rope_bitboards[0] | self.rope_bitboards[1]
+        while mask:
+            low = mask & -mask
+            positions.add(divmod(low.bit_length() - 1, self.board_size))
+            mask ^= low
         return positions
     
     def get_current_player_position(self) -> Tuple[int, int]:
         """Get current player's position"""
-        return (self.player1_pos if self.current_player == Player.PLAYER1 
+        return (self.player1_pos if self.current_player is _PLAYER1 
                 else self.player2_pos)
     
     def get_opponent_position(self) -> Tuple[int, int]:
         """Get opponent's position"""
-        return (self.player2_pos if self.current_player == Player.PLAYER1 
+        return (self.player2_pos if self.current_player is _PLAYER1 
                 else self.player1_pos)
     
     def get_current_player_ropes(self) -> int:
         """Get current player's remaining ropes"""
-        return (self.player1_ropes if self.current_player == Player.PLAYER1 
+        return (self.player1_ropes if self.current_player is _PLAYER1 
                 else self.player2_ropes)
     
     def get_current_player_rope_obstacles(self) -> int:
         """Get current player's remaining rope obstacles to place"""
-        return (self.player1_rope_obstacles if self.current_player == Player.PLAYER1 
+        return (self.player1_rope_obstacles if self.current_player is _PLAYER1 
                 else self.player2_rope_obstacles)
     
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
@@ -129,7 +318,7 @@ class GameState:
     
     def is_game_over(self) -> bool:
         """Check if game is over (someone reached the prize)"""
-        if self.game_phase != GamePhase.PLAYING:
+        if self.game_phase is not _PLAYING:
             return False
         return (self.player1_pos == self.prize_pos or 
                 self.player2_pos == self.prize_pos)
@@ -146,87 +335,76 @@ class GameState:
     
     def get_possible_moves(self) -> List[Tuple[int, int]]:
         """Get all valid move positions for current player"""
-        current_pos = self.get_current_player_position()
-        moves = []
-        
-        for direction in Direction:
-            new_pos = (current_pos[0] + direction.value[0], 
-                      current_pos[1] + direction.value[1])
-            if self.is_valid_position(new_pos):
-                moves.append(new_pos)
-        
-        return moves
+        landings = _landing_table(self.board_size)[self.get_current_player_position()]
+        # Bounds are baked into the landing table; only walls need checking
+        if not self.walls:
+            return list(landings)
+        return [pos for pos in landings if pos not in self.walls]
     
-    def get_possible_actions(self) -> List[Dict]:
+    def get_possible_actions(self) -> List[Action]:
         """Get all possible actions for current player"""
         actions = []
         
-        if self.game_phase == GamePhase.PLAYING:
+        if self.game_phase is _PLAYING:
+            table = _action_table(self.board_size)
+            
             # Movement actions
+            move_actions = table['move']
             for move_pos in self.get_possible_moves():
-                actions.append({
-                    'type': ActionType.MOVE,
-                    'position': move_pos,
-                    'description': f"Move to {move_pos}"
-                })
+                actions.append(move_actions[move_pos])
             
             # Rope placement actions - available throughout the game
             if self.get_current_player_rope_obstacles() > 0:
-                # Get current player's existing rope positions to prevent overlap
-                current_player_rope_positions = set()
-                for cells, rope_player, used in self.rope_obstacles:
-                    if rope_player == self.current_player:
-                        current_player_rope_positions.update(cells)
-                
-                directions = {
-                    'down': (1, 0),
-                    'diagonal_right': (1, 1),
-                    'diagonal_left': (1, -1)
-                }
-                for row in range(self.board_size):
-                    for col in range(self.board_size):
-                        start_pos = (row, col)
-                        # Check if start position is valid (only restrict prize and walls)
-                        if (start_pos != self.prize_pos and
-                            start_pos not in self.walls):
-                            for dir_name, (dr, dc) in directions.items():
-                                cells = [(row + dr * i, col + dc * i) for i in range(3)]
-                                # All cells must be within board bounds and not overlap with forbidden positions
-                                valid = True
-                                for cell in cells:
-                                    r, c = cell
-                                    if not (0 <= r < self.board_size and 0 <= c < self.board_size):
-                                        valid = False
-                                        break
-                                    # Restrict prize position, walls, current player's own rope positions, and current player positions
-                                    if (cell == self.prize_pos or cell in self.walls or 
-                                        cell in current_player_rope_positions or
-                                        cell == self.player1_pos or cell == self.player2_pos):
-                                        valid = False
-                                        break
-                                if valid:
-                                    actions.append({
-                                        'type': ActionType.PLACE_ROPE_OBSTACLE,
-                                        'segment': tuple(cells),
-                                        'direction': dir_name,
-                                        'description': f"Place rope {dir_name.upper()} from {start_pos}"
-                                    })
+                forbidden = self._rope_forbidden_mask()
+                actions.extend([action for action, mask in zip(table['rope'], table['rope_masks'])
+                                if not mask & forbidden])
         return actions
     
+    def get_rope_threat_actions(self) -> List[Action]:
+        """Get the current player's valid rope placements with the head on a cell the opponent can step to next"""
+        actions = []
+        if self.game_phase is _PLAYING and self.get_current_player_rope_obstacles() > 0:
+            forbidden = self._rope_forbidden_mask()
+            rope_by_head = _action_table(self.board_size)['rope_by_head']
+            for head in _landing_table(self.board_size)[self.get_opponent_position()]:
+                for action, mask in rope_by_head.get(head, ()):
+                    if not mask & forbidden:
+                        actions.append(action)
+        return actions
+    
+    def _rope_forbidden_mask(self) -> int:
+        """Bitboard of the cells the current player's next rope may not cover"""
+        # Restrict prize position, walls, current player's own rope positions
+        # (no overlap), and current player positions
+        n = self.board_size
+        forbidden = (self.rope_bitboards[0 if self.current_player is _PLAYER1 else 1] |
+                     1 << (self.prize_pos[0] * n + self.prize_pos[1]) |
+                     1 << (self.player1_pos[0] * n + self.player1_pos[1]) |
+                     1 << (self.player2_pos[0] * n + self.player2_pos[1]))
+        for row, col in self.walls:
+            forbidden |= 1 << (row * n + col)
+        return forbidden
+    
     def check_rope_trigger(self, position):
         """Check if a player stepping on a position triggers an opponent's rope"""
+        # Most steps land off the opponent's ropes, which one bit test rules out
+        opponent_ropes = self.rope_bitboards[1 if self.current_player is _PLAYER1 else 0]
+        if not opponent_ropes >> (position[0] * self.board_size + position[1]) & 1:
+            return False, position
         for i, (cells, rope_player, used) in enumerate(self.rope_obstacles):
             if (position == cells[0] and 
                 not used and 
                 rope_player != self.current_player):  # Only opponent's unused rope triggers push-back
                 # Mark rope as used
+                self.rope_obstacles = self.rope_obstacles[:]
                 self.rope_obstacles[i] = (cells, rope_player, True)
+                rope_delta = self._rope_key(cells, rope_player, False) ^ self._rope_key(cells, rope_player, True)
+                self.rope_zobrist ^= rope_delta
+                self.zobrist ^= rope_delta
                 # Push player from stepped cell to the last cell in the rope (tail)
                 pushed_pos = cells[-1]  # Move directly to the rope's tail
-                if self.current_player == Player.PLAYER1:
-                    self.player1_pos = pushed_pos
-                else:
-                    self.player2_pos = pushed_pos
+                self._set_player_pos(self.current_player, pushed_pos,
+                                     pushed_pos[0] * self.board_size + pushed_pos[1])
                 if self.verbose:
                     print(f"Player {self.current_player.name} stepped on opponent's rope at {position} and was pushed along the rope to {pushed_pos}")
                 return True, pushed_pos
@@ -235,116 +413,129 @@ class GameState:
     def climb_ladders_if_on_base(self):
         """If the current player is on a ladder base, climb to the top (repeat if chained)."""
         climbed = False
-        while True:
-            player_pos = self.player1_pos if self.current_player == Player.PLAYER1 else self.player2_pos
-            found = False
-            for start_pos, end_pos in self.ladders:
-                if player_pos == start_pos:
-                    if self.current_player == Player.PLAYER1:
-                        self.player1_pos = end_pos
-                    else:
-                        self.player2_pos = end_pos
-                    if self.verbose:
-                        print(f"Player {self.current_player.name} climbed ladder from {start_pos} to {end_pos}")
-                    
-                    # Check if landing position triggers a rope
-                    rope_triggered, final_pos = self.check_rope_trigger(end_pos)
-                    if rope_triggered:
-                        # Check if rope tail is also on a ladder base (for chaining)
-                        pass  # The rope trigger already moved the player
-                    
-                    found = True
-                    climbed = True
-                    break
-            if not found:
-                break
+        ladder_tops = self._ladder_tops
+        player_pos = self.player1_pos if self.current_player is _PLAYER1 else self.player2_pos
+        while player_pos in ladder_tops:
+            end_pos = ladder_tops[player_pos]
+            self._set_player_pos(self.current_player, end_pos, end_pos[0] * self.board_size + end_pos[1])
+            if self.verbose:
+                print(f"Player {self.current_player.name} climbed ladder from {player_pos} to {end_pos}")
+            # Landing on an opponent's rope pushes the player to its tail, which
+            # may be another ladder's base
+            _, player_pos = self.check_rope_trigger(end_pos)
+            climbed = True
         return climbed
 
-    def apply_action(self, action: Dict) -> 'GameState':
+    def _clone(self) -> 'GameState':
+        """Copy of this state that shares everything that is never mutated in place"""
+        new = GameState.__new__(GameState)
+        new.board_size = self.board_size
+        new.max_ropes = self.max_ropes
+        new.verbose = self.verbose
+        new.player1_pos = self.player1_pos
+        new.player2_pos = self.player2_pos
+        new.prize_pos = self.prize_pos
+        new.player1_ropes = self.player1_ropes
+        new.player2_ropes = self.player2_ropes
+        new.player1_rope_obstacles = self.player1_rope_obstacles
+        new.player2_rope_obstacles = self.player2_rope_obstacles
+        # Both rope lists are copy-on-write, and walls and ladders never change after setup
+        new.rope_obstacles = self.rope_obstacles
+        new.rope_bitboards = self.rope_bitboards
+        new.walls = self.walls
+        new.ladders = self.ladders
+        new._ladder_tops = self._ladder_tops
+        new.current_player = self.current_player
+        new.turn_count = self.turn_count
+        new.game_phase = self.game_phase
+        new.rope_zobrist = self.rope_zobrist
+        new.zobrist = self.zobrist
+        new.winner = self.winner
+        new._keys = self._keys
+        return new
+    
+    def apply_action(self, action: Action) -> 'GameState':
         """Apply action and return new game state"""
-        new_state = copy.deepcopy(self)
-        # At the start of the turn, climb ladders if on base
-        new_state.climb_ladders_if_on_base()
+        new_state = self._clone()
+        new_state.apply_inplace(action)
+        return new_state
+    
+    def apply_inplace(self, action: Action) -> Tuple:
+        """
+        Apply action to this state in place
         
-        if action['type'] == ActionType.MOVE:
-            # Validate move
-            if action['position'] not in self.get_possible_moves():
-                raise ValueError(f"Invalid move: {action['position']} not in possible moves")
+        Returns:
+            Undo token that undo() uses to restore the state as it was
+        """
+        # Validate move before anything changes
+        if action.type is _MOVE and (
+                action.position not in _landing_table(self.board_size)[self.get_current_player_position()] or
+                action.position in self.walls):
+            raise ValueError(f"Invalid move: {action.position} not in possible moves")
+        undo_token = (self.player1_pos, self.player2_pos,
+                      self.player1_rope_obstacles, self.player2_rope_obstacles,
+                      self.rope_obstacles, self.rope_bitboards, self.rope_zobrist, self.zobrist,
+                      self.current_player, self.turn_count, self.winner)
+        # No climb is needed at the start of the turn: the previous call already
+        # resolved any ladder under the player whose turn it is now
+        
+        if action.type is _MOVE:
             # Apply move
-            if new_state.current_player == Player.PLAYER1:
-                new_state.player1_pos = action['position']
-            else:
-                new_state.player2_pos = action['position']
+            self._set_player_pos(self.current_player, action.position, action.cell)
             # Check if player stepped on an opponent's unused rope (only at the head)
-            rope_triggered, final_pos = new_state.check_rope_trigger(action['position'])
-            if rope_triggered:
-                # Check for ladder at pushed position (rope tail)
-                player_pos = new_state.player1_pos if new_state.current_player == Player.PLAYER1 else new_state.player2_pos
-                for start_pos, end_pos in new_state.ladders:
-                    if player_pos == start_pos:
-                        # Climb ladder
-                        if new_state.current_player == Player.PLAYER1:
-                            new_state.player1_pos = end_pos
-                        else:
-                            new_state.player2_pos = end_pos
-                        if new_state.verbose:
-                            print(f"Player {new_state.current_player.name} climbed ladder from {start_pos} to {end_pos}")
-                        
-                        # Check if landing position from ladder also triggers a rope
-                        rope_triggered_again, final_pos_2 = new_state.check_rope_trigger(end_pos)
-                        break
-            
-            # After handling rope trigger, check for ladders based on final position  
-            final_pos = final_pos if rope_triggered else action['position']
-            new_state.climb_ladders_if_on_base()
+            self.check_rope_trigger(action.position)
+            # Climb any ladder at the final position (the rope tail if pushed)
+            self.climb_ladders_if_on_base()
             
-        elif action['type'] == ActionType.PLACE_ROPE_OBSTACLE:
-            cells = action['segment']
-            direction = action['direction']
+        elif action.type is _PLACE_ROPE:
+            cells = action.segment
             # Add new rope obstacle
-            player_ropes = new_state.player1_rope_obstacles if new_state.current_player == Player.PLAYER1 else new_state.player2_rope_obstacles
+            player_ropes = self.player1_rope_obstacles if self.current_player is _PLAYER1 else self.player2_rope_obstacles
             if player_ropes > 0:
-                new_state.rope_obstacles.append((cells, new_state.current_player, False))
-                if new_state.current_player == Player.PLAYER1:
-                    new_state.player1_rope_obstacles -= 1
+                side = 0 if self.current_player is _PLAYER1 else 1
+                self.rope_obstacles = self.rope_obstacles + [(cells, self.current_player, False)]
+                self.rope_bitboards = self.rope_bitboards[:]
+                self.rope_bitboards[side] |= action.mask
+                rope_key = self._keys['rope'][side][False][action.key_index]
+                placed_keys = self._keys['ropes_placed'][side]
+                placed = self.max_ropes - player_ropes
+                self.rope_zobrist ^= rope_key
+                self.zobrist ^= rope_key ^ placed_keys[placed] ^ placed_keys[placed + 1]
+                if self.current_player is _PLAYER1:
+                    self.player1_rope_obstacles -= 1
                 else:
-                    new_state.player2_rope_obstacles -= 1
+                    self.player2_rope_obstacles -= 1
         
         else:
             # Handle other action types
             pass
         
         # Check if someone won
-        if new_state.player1_pos == new_state.prize_pos:
-            new_state.winner = Player.PLAYER1
-            return new_state
-        elif new_state.player2_pos == new_state.prize_pos:
-            new_state.winner = Player.PLAYER2
-            return new_state
+        if self.player1_pos == self.prize_pos:
+            self.winner = _PLAYER1
+            return undo_token
+        elif self.player2_pos == self.prize_pos:
+            self.winner = _PLAYER2
+            return undo_token
         
-        # Check for ladders again after rope placement for current player
-        for start_pos, end_pos in new_state.ladders:
-            # Check current player position
-            current_pos = new_state.player1_pos if new_state.current_player == Player.PLAYER1 else new_state.player2_pos
-            if current_pos == start_pos:
-                # Climb ladder  
-                if new_state.current_player == Player.PLAYER1:
-                    new_state.player1_pos = end_pos
-                else:
-                    new_state.player2_pos = end_pos
-                if new_state.verbose:
-                    print(f"Player {new_state.current_player.name} climbed ladder from {start_pos} to {end_pos}")
-                
-                # Check if landing position from ladder triggers a rope
-                rope_triggered_from_ladder, final_pos_3 = new_state.check_rope_trigger(end_pos)
-                break
         # Switch player and increment turn
-        new_state.current_player = (Player.PLAYER2 if new_state.current_player == Player.PLAYER1 
-                                   else Player.PLAYER1)
-        new_state.turn_count += 1
+        self.current_player = (_PLAYER2 if self.current_player is _PLAYER1 
+                               else _PLAYER1)
+        self.turn_count += 1
+        if self.turn_count >= len(_ZOBRIST_TURN):
+            _zobrist_turn(self.turn_count)
+        self.zobrist ^= (self._keys['side'] ^
+                         _ZOBRIST_TURN[self.turn_count - 1] ^ _ZOBRIST_TURN[self.turn_count])
         # After switching, climb ladders for the new player
-        new_state.climb_ladders_if_on_base()
-        return new_state
+        self.climb_ladders_if_on_base()
+        return undo_token
+    
+    def undo(self, undo_token: Tuple):
+        """Restore the state from before the apply_inplace() call that returned undo_token"""
+        (self.player1_pos, self.player2_pos,
+         self.player1_rope_obstacles, self.player2_rope_obstacles,
+         self.rope_obstacles, self.rope_bitboards, self.rope_zobrist, self.zobrist,
+         self.current_player, self.turn_count, self.winner) = undo_token
     
     def print_board(self, use_colors: bool = True):
         """Print current board state with optional colors"""
@@ -386,48 +577,26 @@ class GameState:
         print(f"{BOLD}{'='*60}{RESET}")
 
     def _place_random_ladders(self):
-        directions = [  # (row_delta, col_delta)
-            (1, 0),    # up
-            (1, 1),    # up-right
-            (1, -1),   # up-left
-        ]
-        attempts = 0
-        while len(self.ladders) < 3 and attempts < 100:
-            attempts += 1
-            length = random.randint(2, 4)
-            dir_idx = random.randint(0, 2)
-            d_row, d_col = directions[dir_idx]
-            start_row = random.randint(0, self.board_size - length - 1)
-            start_col = random.randint(0, self.board_size - 1)
-            # For diagonals, ensure col stays in bounds
-            if d_col == 1:
-                if start_col > self.board_size - length - 1:
-                    continue
-            elif d_col == -1:
-                if start_col < length:
-                    continue
-            # Compute end position
-            end_row = start_row + d_row * (length - 1)
-            end_col = start_col + d_col * (length - 1)
-            if not (0 <= end_row < self.board_size and 0 <= end_col < self.board_size):
-                continue
-            start_pos = (start_row, start_col)
-            end_pos = (end_row, end_col)
-            # Ensure base is always the cell with the highest row (bottom-most), top is lowest row (top-most)
-            if start_pos[0] > end_pos[0]:
-                base, top = start_pos, end_pos
-            else:
-                base, top = end_pos, start_pos
-            # Check for overlap with players, prize, ropes, or other ladders
-            ladder_cells = [(start_row + d_row * i, start_col + d_col * i) for i in range(length)]
-            forbidden = set([self.player1_pos, self.player2_pos, self.prize_pos])
-            forbidden.update(self.get_rope_obstacle_positions())
-            for l in self.ladders:
-                forbidden.add(l[0])
-                forbidden.add(l[1])
-            if any(cell in forbidden for cell in ladder_cells):
+        """Place up to 3 ladders drawn at random, without replacement, from the candidates that fit"""
+        # Ladders may not touch the players, the prize, ropes, or another ladder's ends
+        forbidden = {self.player1_pos, self.player2_pos, self.prize_pos}
+        forbidden.update(self.get_rope_obstacle_positions())
+        for start_pos, end_pos in self.ladders:
+            forbidden.add(start_pos)
+            forbidden.add(end_pos)
+        pool = list(_ladder_candidates(self.board_size))
+        remaining = len(pool)
+        while len(self.ladders) < 3 and remaining:
+            # Take a random candidate out of the pool by swapping the last one into its place
+            i = random.randrange(remaining)
+            base, top, cells = pool[i]
+            remaining -= 1
+            pool[i] = pool[remaining]
+            if any(cell in forbidden for cell in cells):
                 continue
             self.ladders.append((base, top))
+            forbidden.add(base)
+            forbidden.add(top)
 
 
 # Import the new MinimaxPruning AI system
@@ -437,8 +606,10 @@ from minimax_pruning import MinimaxPruning
 class OptimizedMinimaxAgent:
     """Wrapper for backward compatibility - uses new MinimaxPruning system"""
     
-    def __init__(self, max_depth: int = 5, time_limit: float = 3.0, verbose: bool = True):
-        self.ai = MinimaxPruning(max_depth=max_depth, time_limit=time_limit, verbose=verbose)
+    def __init__(self, max_depth: int = 5, time_limit: float = 3.0, verbose: bool = False,
+                 parallel: bool = False):
+        self.ai = MinimaxPruning(max_depth=max_depth, time_limit=time_limit, verbose=verbose,
+                                 parallel=parallel)
         self.max_depth = max_depth
         self.time_limit = time_limit
         
@@ -446,7 +617,19 @@ class OptimizedMinimaxAgent:
         """Clear transposition table"""
         self.ai.clear_cache()
     
-    def get_best_move(self, state: GameState, use_iterative_deepening: bool = True) -> Dict:
+    def close(self):
+        """Shut down the worker processes used by parallel search"""
+        self.ai.close()
+    
+    def set_verbose(self, verbose: bool):
+        """Switch analysis messages on or off without dropping the transposition table"""
+        self.ai.set_verbose(verbose)
+    
+    def reset_stats(self):
+        """Reset node and pruning counters"""
+        self.ai.reset_stats()
+    
+    def get_best_move(self, state: GameState, use_iterative_deepening: bool = True) -> Action:
         """Get the best move using the new AI system"""
         return self.ai.get_best_move(state, use_iterative_deepening)
     
@@ -458,9 +641,28 @@ class OptimizedMinimaxAgent:
     def pruning_count(self):
         return self.ai.pruning_count
     
+    @property
+    def quiescence_nodes(self):
+        return self.ai.quiescence_nodes
+    
+    @property
+    def last_search_stats(self):
+        return self.ai.last_search_stats
+    
     @property
     def transposition_table(self):
-        return self.ai.transposition_table
+        """Snapshot of the cached entries as {state_hash: (depth, value, action)}"""
+        table = {}
+        # Depth-preferred entries go in last so they win over an older duplicate
+        for tier in (self.ai.tt_always_replace, self.ai.tt_depth_preferred):
+            for entry in tier:
+                if entry is not None:
+                    table[entry[0]] = entry[1:4]
+        return table
+    
+    def cache_bytes(self) -> int:
+        """Approximate memory used by the AI's transposition table, in bytes"""
+        return self.ai.cache_bytes()
 
 
 # Keep original MinimaxAgent for backward compatibility
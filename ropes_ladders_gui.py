@@ -2,11 +2,13 @@ import pygame
 import sys
 import math
 import time
+import queue
+import threading
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
 
 # Import our existing game logic and new AI system
-from ropes_ladders_game import GameState, Player, ActionType, OptimizedMinimaxAgent, Direction, GamePhase
+from ropes_ladders_game import GameState, Player, ActionType, OptimizedMinimaxAgent, Direction, GamePhase, Action
 from minimax_pruning import MinimaxPruning
 
 # Initialize Pygame
@@ -58,6 +60,13 @@ class RopesLaddersGUI:
         self.CELL_SIZE = 45
         self.BOARD_OFFSET_X = 75
         self.BOARD_OFFSET_Y = 50
+        self.board_span = self.BOARD_SIZE * self.CELL_SIZE  # Board width and height in pixels
+        
+        # Screen position of each cell's top-left corner and center, indexed [row][col]
+        self.cell_px = [[(self.BOARD_OFFSET_X + col * self.CELL_SIZE, self.BOARD_OFFSET_Y + row * self.CELL_SIZE)
+                         for col in range(self.BOARD_SIZE)] for row in range(self.BOARD_SIZE)]
+        self.cell_center_px = [[(x + self.CELL_SIZE // 2, y + self.CELL_SIZE // 2) for x, y in cells]
+                               for cells in self.cell_px]
         
         # Game state
         self.game_state = GameState(self.BOARD_SIZE, max_ropes=3, verbose=False)
@@ -69,14 +78,26 @@ class RopesLaddersGUI:
         self.drag_start = None
         self.current_segment = []
         
-        # AI - Use new MinimaxPruning system for enhanced strategic play
-        self.ai_agent = MinimaxPruning(verbose=True)
+        # Search progress printing from the AI, off by default
+        self.debug_output = False
+        
+        # AI - Use new MinimaxPruning system for enhanced strategic play.
+        # The search keeps deepening for most of the delay between AI moves,
+        # so max_depth is only a ceiling.
+        self.ai_auto_delay = 1.5  # Slightly longer delay so players can see moves
+        self.ai_agent = MinimaxPruning(max_depth=12, time_limit=self.ai_auto_delay * 0.9,
+                                       verbose=self.debug_output)
         self.ai_thinking = False
         self.ai_start_time = 0
         self.ai_vs_ai_mode = False
         self.ai_vs_ai_paused = False
-        self.ai_auto_delay = 1.5  # Slightly longer delay so players can see moves
         self.last_ai_move_time = 0
+        self.last_tick = pygame.time.get_ticks()  # Time of the previous update(), in ms
+        self.pending_ai_action = None  # Move found by the AI, played once the delay has passed
+        # The search runs on a worker thread and posts its move to ai_results
+        self.ai_thread = None
+        self.ai_cancel = None
+        self.ai_results = queue.Queue()
         
         # Game modes
         self.human_vs_ai = True  # True for Human vs AI, False for AI vs AI
@@ -84,31 +105,126 @@ class RopesLaddersGUI:
         # Rope placement mode
         self.rope_placement_mode = False
         self.available_rope_actions = []
+        # Highlight rectangles and click lookups (target cell -> action), recomputed
+        # when the action lists they come from are replaced
+        self.move_highlights = []
+        self.move_by_pos = {}
+        self.move_highlights_source = None
+        self.rope_highlights = []
+        self.rope_by_head = {}
+        self.rope_highlights_source = None
         
         # UI
         self.buttons = []
+        self.hovered_button = None
+        # Clickable buttons by horizontal band (y // BUTTON_BAND_HEIGHT), for hit tests
+        self.BUTTON_BAND_HEIGHT = 32
+        self.button_bands = {}
+        # Button sets are reused until the screen or turn they belong to changes
+        self.menu_buttons = None
+        self.game_over_buttons = None
+        # Rendered game over panel for the finished game in game_over_panel_source
+        self.game_over_panel = None
+        self.game_over_panel_source = None
+        self.game_buttons_key = None
+        self.game_buttons = []
+        self.panel_buttons = []
+        self.panel_labels = []
+        self.mode_buttons = []
+        # Rendered info panel lines for the state and game type in info_panel_key
+        self.info_panel_key = None
+        self.info_panel_lines = []
+        self.info_panel_bottom = 0
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 18)
+        # Rendered rope surfaces and positions by (cells, player, used), see build_rope_surface
+        self.rope_surfaces = {}
+        # Rendered text surfaces by (text, color, font), see render_text
+        self.text_cache = {}
+        self.TEXT_CACHE_LIMIT = 512
+        
+        # Pre-rendered board background (checkerboard, borders, cell labels and
+        # ladders), rebuilt only when the board, cell size or ladders change
+        self.board_surface = None
+        self.board_surface_key = None
         
         # Initialize screen
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        # Paces the main loop; tick() sleeps away the rest of each frame
+        self.clock = pygame.time.Clock()
+        self.FPS = 60
         pygame.display.set_caption("Ropes & Ladders - Strategic Edition")
         
-        # Disable debug output during AI simulation
-        self.debug_output = True
+        # Drop events the GUI never handles (keys, text input, joysticks...) at the
+        # SDL layer. Expose events stay, since they are what repaints an uncovered window.
+        # WINDOWEXPOSED is only a top-level constant in later pygame 2 releases.
+        pygame.event.set_blocked(None)
+        allowed_events = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                          pygame.VIDEOEXPOSE, getattr(pygame, 'WINDOWEXPOSED', None)]
+        pygame.event.set_allowed([event for event in allowed_events if event is not None])
+        
+        # Semi-transparent overlays, created once in the screen's pixel format
+        self.drag_rope_surface = pygame.Surface((self.CELL_SIZE // 3, self.CELL_SIZE // 8), pygame.SRCALPHA)
+        self.drag_rope_surface.fill((139, 69, 19, 128))  # Brown with alpha
+        self.drag_rope_surface = self.drag_rope_surface.convert_alpha()
+        self.game_over_overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+        self.game_over_overlay.set_alpha(180)
+        self.game_over_overlay.fill(Colors.BLACK)
+        
+        # Player pieces and the prize, drawn once and blitted centered on their cells
+        self.player1_sprite = self.build_piece_sprite(Colors.BLUE, Colors.WHITE, self.CELL_SIZE // 6, 2,
+                                                      "1", Colors.WHITE, self.small_font)
+        self.player2_sprite = self.build_piece_sprite(Colors.RED, Colors.WHITE, self.CELL_SIZE // 6, 2,
+                                                      "2", Colors.WHITE, self.small_font)
+        self.prize_sprite = self.build_piece_sprite(Colors.PRIZE_COLOR, Colors.ORANGE, self.CELL_SIZE // 3, 3,
+                                                    "P", Colors.ORANGE, self.font)
+        
+        # The screen is only redrawn after something visible changed, and only
+        # the dirty rectangles are presented (None presents the whole screen)
+        self.needs_redraw = True
+        self.dirty_rects = None
+        self.board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y,
+                                      self.BOARD_SIZE * self.CELL_SIZE, self.BOARD_SIZE * self.CELL_SIZE)
+        panel_x = self.board_rect.right + 30
+        self.panel_rect = pygame.Rect(panel_x, 0, self.SCREEN_WIDTH - panel_x, self.SCREEN_HEIGHT)
+    
+    def request_redraw(self, rect: Optional[pygame.Rect] = None):
+        """Redraw the screen on the next frame, presenting only rect if given"""
+        self.needs_redraw = True
+        if rect is None:
+            self.dirty_rects = None
+        elif self.dirty_rects is not None:
+            self.dirty_rects.append(rect)
     
     def create_button(self, x: int, y: int, width: int, height: int, text: str, 
                      action: str, color: Tuple[int, int, int] = Colors.BUTTON_NORMAL) -> Dict:
         """Create a button dictionary"""
+        rect = pygame.Rect(x, y, width, height)
+        # The label looks the same with and without hover, so it is rendered once
+        label = self.render_text(text, Colors.WHITE, self.font)
         return {
-            'rect': pygame.Rect(x, y, width, height),
+            'rect': rect,
             'text': text,
             'action': action,
             'color': color,
-            'hover': False
+            'hover': False,
+            'label_surface': label,
+            'label_rect': label.get_rect(center=rect.center)
         }
     
+    def render_text(self, text: str, color: Tuple[int, int, int], font: pygame.font.Font) -> pygame.Surface:
+        """Render text with antialiasing, reusing the surface from an earlier call with the same arguments"""
+        key = (text, color, id(font))
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Texts with changing numbers (turns, positions) keep adding entries
+            if len(self.text_cache) >= self.TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+    
     def draw_button(self, button: Dict):
         """Draw a button with hover effects"""
         color = Colors.BUTTON_HOVER if button['hover'] else button['color']
@@ -116,17 +232,15 @@ class RopesLaddersGUI:
         pygame.draw.rect(self.screen, Colors.BLACK, button['rect'], 2)
         
         # Button text
-        text_surface = self.font.render(button['text'], True, Colors.WHITE)
-        text_rect = text_surface.get_rect(center=button['rect'].center)
-        self.screen.blit(text_surface, text_rect)
+        self.screen.blit(button['label_surface'], button['label_rect'])
     
     def draw_main_menu(self):
         """Draw the main menu"""
         self.screen.fill(Colors.WHITE)
         
         # Title
-        title_text = self.title_font.render("Ropes & Ladders", True, Colors.DARK_GRAY)
-        subtitle_text = self.font.render("Strategic Edition with AI", True, Colors.GRAY)
+        title_text = self.render_text("Ropes & Ladders", Colors.DARK_GRAY, self.title_font)
+        subtitle_text = self.render_text("Strategic Edition with AI", Colors.GRAY, self.font)
         
         title_rect = title_text.get_rect(center=(self.SCREEN_WIDTH // 2, 150))
         subtitle_rect = subtitle_text.get_rect(center=(self.SCREEN_WIDTH // 2, 190))
@@ -134,8 +248,7 @@ class RopesLaddersGUI:
         self.screen.blit(title_text, title_rect)
         self.screen.blit(subtitle_text, subtitle_rect)
         
-        # Menu buttons
-        self.buttons = []
+        # Menu buttons, created once
         button_width = 300
         button_height = 60
         button_x = (self.SCREEN_WIDTH - button_width) // 2
@@ -148,10 +261,13 @@ class RopesLaddersGUI:
             ("Exit", "exit")
         ]
         
-        for i, (text, action) in enumerate(menu_options):
-            y = start_y + i * (button_height + 20)
-            button = self.create_button(button_x, y, button_width, button_height, text, action)
-            self.buttons.append(button)
+        if self.menu_buttons is None:
+            self.menu_buttons = []
+            for i, (text, action) in enumerate(menu_options):
+                y = start_y + i * (button_height + 20)
+                self.menu_buttons.append(self.create_button(button_x, y, button_width, button_height, text, action))
+        self.set_buttons(self.menu_buttons)
+        for button in self.menu_buttons:
             self.draw_button(button)
         
         # Current settings display
@@ -163,79 +279,87 @@ class RopesLaddersGUI:
         ]
         
         for i, text in enumerate(settings_text):
-            text_surface = self.small_font.render(text, True, Colors.GRAY)
+            text_surface = self.render_text(text, Colors.GRAY, self.small_font)
             text_rect = text_surface.get_rect(center=(self.SCREEN_WIDTH // 2, settings_y + i * 25))
             self.screen.blit(text_surface, text_rect)
     
-    def draw_board(self):
-        """Draw the game board"""
-        if not self.game_state:
-            return
+    def build_board_surface(self):
+        """Render the static board background (grid, cell labels and ladders) once per game"""
+        board_pixels = self.BOARD_SIZE * self.CELL_SIZE
+        surface = pygame.Surface((board_pixels, board_pixels)).convert()
         
         # Board background
-        board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y, self.BOARD_SIZE * self.CELL_SIZE, self.BOARD_SIZE * self.CELL_SIZE)
-        pygame.draw.rect(self.screen, Colors.BOARD_BORDER, board_rect)
-        pygame.draw.rect(self.screen, Colors.BOARD_LIGHT, board_rect, 3)
+        board_rect = surface.get_rect()
+        pygame.draw.rect(surface, Colors.BOARD_BORDER, board_rect)
+        pygame.draw.rect(surface, Colors.BOARD_LIGHT, board_rect, 3)
         
         # Draw grid
         for row in range(self.BOARD_SIZE):
             for col in range(self.BOARD_SIZE):
-                x = self.BOARD_OFFSET_X + col * self.CELL_SIZE
-                y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE
-                
                 # Alternate colors for checkerboard pattern
                 color = Colors.BOARD_LIGHT if (row + col) % 2 == 0 else Colors.BOARD_DARK
-                cell_rect = pygame.Rect(x, y, self.CELL_SIZE, self.CELL_SIZE)
-                pygame.draw.rect(self.screen, color, cell_rect)
-                pygame.draw.rect(self.screen, Colors.BOARD_BORDER, cell_rect, 1)
-                
-                # Draw coordinates and cell number (if cell is large enough)
-                if self.CELL_SIZE > 40:
+                cell_rect = pygame.Rect(col * self.CELL_SIZE, row * self.CELL_SIZE, self.CELL_SIZE, self.CELL_SIZE)
+                pygame.draw.rect(surface, color, cell_rect)
+        
+        # Cell borders as full-length lines along each cell's first and last
+        # pixel, so neighboring cells keep their two-pixel shared border
+        last_pixel = board_pixels - 1
+        for i in range(self.BOARD_SIZE):
+            for line in (i * self.CELL_SIZE, (i + 1) * self.CELL_SIZE - 1):
+                pygame.draw.line(surface, Colors.BOARD_BORDER, (line, 0), (line, last_pixel))
+                pygame.draw.line(surface, Colors.BOARD_BORDER, (0, line), (last_pixel, line))
+        
+        # Draw coordinates and cell number (if cell is large enough)
+        if self.CELL_SIZE > 40:
+            for row in range(self.BOARD_SIZE):
+                for col in range(self.BOARD_SIZE):
+                    x = col * self.CELL_SIZE
+                    y = row * self.CELL_SIZE
                     coord_text = self.small_font.render(f"{row},{col}", True, Colors.LIGHT_GRAY)
-                    self.screen.blit(coord_text, (x + 2, y + 2))
+                    surface.blit(coord_text, (x + 2, y + 2))
                     cell_num = row * self.BOARD_SIZE + col
                     num_text = self.small_font.render(str(cell_num), True, Colors.DARK_GRAY)
                     num_rect = num_text.get_rect(bottomright=(x + self.CELL_SIZE - 2, y + self.CELL_SIZE - 2))
-                    self.screen.blit(num_text, num_rect)
-        
-        # Draw ladders
-        if hasattr(self.game_state, 'ladders'):
-            for start_pos, end_pos in self.game_state.ladders:
-                s_row, s_col = start_pos
-                e_row, e_col = end_pos
-                length = max(abs(e_row - s_row), abs(e_col - s_col)) + 1
-                d_row = (e_row - s_row) // (length - 1) if length > 1 else 0
-                d_col = (e_col - s_col) // (length - 1) if length > 1 else 0
-                # Compute all ladder cells
-                cells = [(s_row + i * d_row, s_col + i * d_col) for i in range(length)]
-                # Draw rails
-                for offset in [-0.25, 0.25]:
-                    rail_points = []
-                    for i, (row, col) in enumerate(cells):
-                        x = self.BOARD_OFFSET_X + (col + offset) * self.CELL_SIZE + self.CELL_SIZE // 2
-                        y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE + self.CELL_SIZE // 2
-                        rail_points.append((x, y))
-                    pygame.draw.lines(self.screen, Colors.BLACK, False, rail_points, 4)
-                # Draw rungs
-                for i in range(length):
-                    row, col = cells[i]
-                    x1 = self.BOARD_OFFSET_X + (col - 0.25) * self.CELL_SIZE + self.CELL_SIZE // 2
-                    x2 = self.BOARD_OFFSET_X + (col + 0.25) * self.CELL_SIZE + self.CELL_SIZE // 2
-                    y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE + self.CELL_SIZE // 2
-                    pygame.draw.line(self.screen, Colors.BLACK, (x1, y), (x2, y), 3)
-
+                    surface.blit(num_text, num_rect)
+        
+        # Draw ladders, which never move during a game
+        half_cell = self.CELL_SIZE // 2
+        rail_offset = 0.25 * self.CELL_SIZE
+        for start_pos, end_pos in self.game_state.ladders:
+            s_row, s_col = start_pos
+            e_row, e_col = end_pos
+            length = max(abs(e_row - s_row), abs(e_col - s_col)) + 1
+            d_row = (e_row - s_row) // (length - 1) if length > 1 else 0
+            d_col = (e_col - s_col) // (length - 1) if length > 1 else 0
+            # Centers of all ladder cells
+            centers = [((s_col + i * d_col) * self.CELL_SIZE + half_cell, (s_row + i * d_row) * self.CELL_SIZE + half_cell)
+                       for i in range(length)]
+            # Draw rails
+            for offset in [-rail_offset, rail_offset]:
+                rail_points = [(x + offset, y) for x, y in centers]
+                pygame.draw.lines(surface, Colors.BLACK, False, rail_points, 4)
+            # Draw rungs
+            for x, y in centers:
+                pygame.draw.line(surface, Colors.BLACK, (x - rail_offset, y), (x + rail_offset, y), 3)
+        
+        self.board_surface = surface
+        self.board_surface_key = (self.BOARD_SIZE, self.CELL_SIZE, self.game_state.ladders)
+    
+    def draw_board(self):
+        """Draw the game board"""
+        if not self.game_state:
+            return
+        
+        # Static background, rendered once per game
+        if self.board_surface_key != (self.BOARD_SIZE, self.CELL_SIZE, self.game_state.ladders):
+            self.build_board_surface()
+        self.screen.blit(self.board_surface, (self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y))
+        
         # Draw prize
         prize_row, prize_col = self.game_state.prize_pos
-        prize_x = self.BOARD_OFFSET_X + prize_col * self.CELL_SIZE + self.CELL_SIZE // 2
-        prize_y = self.BOARD_OFFSET_Y + prize_row * self.CELL_SIZE + self.CELL_SIZE // 2
-        
-        pygame.draw.circle(self.screen, Colors.PRIZE_COLOR, (prize_x, prize_y), self.CELL_SIZE // 3)
-        pygame.draw.circle(self.screen, Colors.ORANGE, (prize_x, prize_y), self.CELL_SIZE // 3, 3)
+        prize_x, prize_y = self.cell_center_px[prize_row][prize_col]
         
-        # Prize text
-        prize_text = self.font.render("P", True, Colors.ORANGE)
-        prize_rect = prize_text.get_rect(center=(prize_x, prize_y))
-        self.screen.blit(prize_text, prize_rect)
+        self.screen.blit(self.prize_sprite, self.prize_sprite.get_rect(center=(prize_x, prize_y)))
         
         # Draw rope obstacles
         self.draw_rope_obstacles()
@@ -256,70 +380,83 @@ class RopesLaddersGUI:
         
         # Player 1
         p1_row, p1_col = self.game_state.player1_pos
-        p1_x = self.BOARD_OFFSET_X + p1_col * self.CELL_SIZE + self.CELL_SIZE // 4
-        p1_y = self.BOARD_OFFSET_Y + p1_row * self.CELL_SIZE + self.CELL_SIZE // 2
-        
-        pygame.draw.circle(self.screen, Colors.BLUE, (p1_x, p1_y), self.CELL_SIZE // 6)
-        pygame.draw.circle(self.screen, Colors.WHITE, (p1_x, p1_y), self.CELL_SIZE // 6, 2)
-        
-        # Player 1 number
-        p1_text = self.small_font.render("1", True, Colors.WHITE)
-        p1_rect = p1_text.get_rect(center=(p1_x, p1_y))
-        self.screen.blit(p1_text, p1_rect)
+        p1_x = self.cell_px[p1_row][p1_col][0] + self.CELL_SIZE // 4
+        p1_y = self.cell_center_px[p1_row][p1_col][1]
+        self.screen.blit(self.player1_sprite, self.player1_sprite.get_rect(center=(p1_x, p1_y)))
         
         # Player 2
         p2_row, p2_col = self.game_state.player2_pos
-        p2_x = self.BOARD_OFFSET_X + p2_col * self.CELL_SIZE + 3 * self.CELL_SIZE // 4
-        p2_y = self.BOARD_OFFSET_Y + p2_row * self.CELL_SIZE + self.CELL_SIZE // 2
-        
-        pygame.draw.circle(self.screen, Colors.RED, (p2_x, p2_y), self.CELL_SIZE // 6)
-        pygame.draw.circle(self.screen, Colors.WHITE, (p2_x, p2_y), self.CELL_SIZE // 6, 2)
-        
-        # Player 2 number
-        p2_text = self.small_font.render("2", True, Colors.WHITE)
-        p2_rect = p2_text.get_rect(center=(p2_x, p2_y))
-        self.screen.blit(p2_text, p2_rect)
+        p2_x = self.cell_px[p2_row][p2_col][0] + 3 * self.CELL_SIZE // 4
+        p2_y = self.cell_center_px[p2_row][p2_col][1]
+        self.screen.blit(self.player2_sprite, self.player2_sprite.get_rect(center=(p2_x, p2_y)))
+    
+    def build_piece_sprite(self, fill_color: Tuple[int, int, int], ring_color: Tuple[int, int, int],
+                           radius: int, ring_width: int, label: str, label_color: Tuple[int, int, int],
+                           font: pygame.font.Font) -> pygame.Surface:
+        """Render a labelled circular piece onto a transparent cell-sized surface"""
+        surface = pygame.Surface((self.CELL_SIZE, self.CELL_SIZE), pygame.SRCALPHA)
+        center = (self.CELL_SIZE // 2, self.CELL_SIZE // 2)
+        pygame.draw.circle(surface, fill_color, center, radius)
+        pygame.draw.circle(surface, ring_color, center, radius, ring_width)
+        text = self.render_text(label, label_color, font)
+        surface.blit(text, text.get_rect(center=center))
+        return surface.convert_alpha()
     
     def draw_rope_obstacles(self):
         """Draw rope obstacles on the board (3-cell segments with diagonal support and player colors)"""
-        if not self.game_state or not hasattr(self.game_state, 'rope_obstacles'):
+        if not self.game_state:
             return
         
-        for i, (cells, player, used) in enumerate(self.game_state.rope_obstacles):
-            # Calculate pixel positions for all cells
-            points = []
-            for row, col in cells:
-                x = self.BOARD_OFFSET_X + col * self.CELL_SIZE + self.CELL_SIZE // 2
-                y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE + self.CELL_SIZE // 2
-                points.append((x, y))
-            # Choose color based on player and used status
-            if used:
-                rope_color = (128, 128, 128)  # Grey
-                rope_dark = (96, 96, 96)     # Darker grey
-            elif player == Player.PLAYER1:
-                rope_color = (52, 152, 219)  # Blue
-                rope_dark = (41, 128, 185)   # Darker blue
-            else:  # PLAYER2
-                rope_color = (231, 76, 60)   # Red
-                rope_dark = (192, 57, 43)    # Darker red
-            # Draw rope as a thick polyline through all cells
-            rope_thickness = 8
-            pygame.draw.lines(self.screen, rope_dark, False, points, rope_thickness)
-            pygame.draw.lines(self.screen, rope_color, False, points, rope_thickness - 2)
-            # Draw rope head (first cell) with special marker
-            head_x, head_y = points[0]
-            head_radius = 10
-            pygame.draw.circle(self.screen, rope_dark, (head_x, head_y), head_radius)
-            pygame.draw.circle(self.screen, rope_color, (head_x, head_y), head_radius - 2)
-            if not used:
-                pygame.draw.circle(self.screen, Colors.WHITE, (head_x, head_y), 4)
-            else:
-                pygame.draw.circle(self.screen, Colors.BLACK, (head_x, head_y), 3)
-            # Draw rope tail (last cell)
-            tail_x, tail_y = points[-1]
-            end_radius = 6
-            pygame.draw.circle(self.screen, rope_dark, (tail_x, tail_y), end_radius)
-            pygame.draw.circle(self.screen, rope_color, (tail_x, tail_y), end_radius - 2)
+        for cells, player, used in self.game_state.rope_obstacles:
+            key = (cells, player, used)
+            cached = self.rope_surfaces.get(key)
+            if cached is None:
+                cached = self.build_rope_surface(cells, player, used)
+                self.rope_surfaces[key] = cached
+            surface, origin = cached
+            self.screen.blit(surface, origin)
+    
+    def build_rope_surface(self, cells, player: Player, used: bool) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render one rope onto a transparent surface covering its bounding box"""
+        # Padding around the cell centers for the head marker and line width
+        padding = 12
+        centers = [self.cell_center_px[row][col] for row, col in cells]
+        left = min(x for x, _ in centers) - padding
+        top = min(y for _, y in centers) - padding
+        width = max(x for x, _ in centers) - left + padding + 1
+        height = max(y for _, y in centers) - top + padding + 1
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        # Calculate pixel positions for all cells, relative to the surface
+        points = [(x - left, y - top) for x, y in centers]
+        # Choose color based on player and used status
+        if used:
+            rope_color = (128, 128, 128)  # Grey
+            rope_dark = (96, 96, 96)     # Darker grey
+        elif player == Player.PLAYER1:
+            rope_color = (52, 152, 219)  # Blue
+            rope_dark = (41, 128, 185)   # Darker blue
+        else:  # PLAYER2
+            rope_color = (231, 76, 60)   # Red
+            rope_dark = (192, 57, 43)    # Darker red
+        # Draw rope as a thick polyline through all cells
+        rope_thickness = 8
+        pygame.draw.lines(surface, rope_dark, False, points, rope_thickness)
+        pygame.draw.lines(surface, rope_color, False, points, rope_thickness - 2)
+        # Draw rope head (first cell) with special marker
+        head_x, head_y = points[0]
+        head_radius = 10
+        pygame.draw.circle(surface, rope_dark, (head_x, head_y), head_radius)
+        pygame.draw.circle(surface, rope_color, (head_x, head_y), head_radius - 2)
+        if not used:
+            pygame.draw.circle(surface, Colors.WHITE, (head_x, head_y), 4)
+        else:
+            pygame.draw.circle(surface, Colors.BLACK, (head_x, head_y), 3)
+        # Draw rope tail (last cell)
+        tail_x, tail_y = points[-1]
+        end_radius = 6
+        pygame.draw.circle(surface, rope_dark, (tail_x, tail_y), end_radius)
+        pygame.draw.circle(surface, rope_color, (tail_x, tail_y), end_radius - 2)
+        return surface, (left, top)
     
     def draw_drag_and_drop(self):
         """Draw drag and drop visual feedback"""
@@ -327,16 +464,8 @@ class RopesLaddersGUI:
             return
         
         # Draw a semi-transparent rope being dragged
-        rope_width = self.CELL_SIZE // 3
-        rope_height = self.CELL_SIZE // 8
-        rope_rect = pygame.Rect(self.drag_start[0] - rope_width // 2, 
-                               self.drag_start[1] - rope_height // 2, 
-                               rope_width, rope_height)
-        
-        # Create a surface with alpha for transparency
-        rope_surface = pygame.Surface((rope_width, rope_height), pygame.SRCALPHA)
-        rope_surface.fill((139, 69, 19, 128))  # Brown with alpha
-        self.screen.blit(rope_surface, rope_rect)
+        rope_rect = self.drag_rope_surface.get_rect(center=self.drag_start)
+        self.screen.blit(self.drag_rope_surface, rope_rect)
     
     def highlight_possible_moves(self):
         """Highlight possible moves for current player"""
@@ -360,43 +489,59 @@ class RopesLaddersGUI:
         
         # If in rope placement mode, highlight rope placement positions
         if self.rope_placement_mode:
-            for action in self.available_rope_actions:
-                cells = action['segment']
-                for i, (row, col) in enumerate(cells):
-                    x = self.BOARD_OFFSET_X + col * self.CELL_SIZE
-                    y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE
-                    
-                    # Draw thick orange border for rope placement positions
-                    # Head (first cell) gets special highlighting
-                    if i == 0:  # Head of rope
-                        highlight_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-                        pygame.draw.rect(self.screen, Colors.ORANGE, highlight_rect, 5)
-                        # Add inner highlight for better visibility
-                        inner_rect = pygame.Rect(x + 5, y + 5, self.CELL_SIZE - 10, self.CELL_SIZE - 10)
-                        pygame.draw.rect(self.screen, Colors.ORANGE, inner_rect, 2)
-                        # Draw white dot to indicate head
-                        center_x = x + self.CELL_SIZE // 2
-                        center_y = y + self.CELL_SIZE // 2
-                        pygame.draw.circle(self.screen, Colors.WHITE, (center_x, center_y), 5)
-                    else:  # Body/tail of rope
-                        highlight_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-                        pygame.draw.rect(self.screen, Colors.YELLOW, highlight_rect, 3)
+            if self.rope_highlights_source is not self.available_rope_actions:
+                self.build_rope_highlights()
+            for highlight_rect, inner_rect, head_center in self.rope_highlights:
+                if head_center is not None:  # Head of rope
+                    pygame.draw.rect(self.screen, Colors.ORANGE, highlight_rect, 5)
+                    pygame.draw.rect(self.screen, Colors.ORANGE, inner_rect, 2)
+                    pygame.draw.circle(self.screen, Colors.WHITE, head_center, 5)
+                else:  # Body/tail of rope
+                    pygame.draw.rect(self.screen, Colors.YELLOW, highlight_rect, 3)
             return
         
+        if self.move_highlights_source is not self.possible_moves:
+            self.build_move_highlights()
+        for highlight_rect, inner_rect in self.move_highlights:
+            pygame.draw.rect(self.screen, Colors.GREEN, highlight_rect, 5)
+            pygame.draw.rect(self.screen, Colors.GREEN, inner_rect, 2)
+    
+    def build_move_highlights(self):
+        """Compute the highlight rectangles and click lookup for the current move actions"""
+        self.move_highlights = []
+        self.move_by_pos = {}
         for action in self.possible_moves:
-            if action['type'] == ActionType.MOVE:
-                row, col = action['position']
-                x = self.BOARD_OFFSET_X + col * self.CELL_SIZE
-                y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE
+            if action.type == ActionType.MOVE:
+                self.move_by_pos[action.position] = action
+                row, col = action.position
+                x, y = self.cell_px[row][col]
                 
                 # Highlight cell with thick border
                 highlight_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-                pygame.draw.rect(self.screen, Colors.GREEN, highlight_rect, 5)
                 # Add inner highlight for better visibility
                 inner_rect = pygame.Rect(x + 5, y + 5, self.CELL_SIZE - 10, self.CELL_SIZE - 10)
-                pygame.draw.rect(self.screen, Colors.GREEN, inner_rect, 2)
-            
-
+                self.move_highlights.append((highlight_rect, inner_rect))
+        self.move_highlights_source = self.possible_moves
+    
+    def build_rope_highlights(self):
+        """Compute the highlight rectangles and click lookup for the rope placements being chosen from"""
+        self.rope_highlights = []
+        self.rope_by_head = {}
+        for action in self.available_rope_actions:
+            cells = action.segment
+            self.rope_by_head.setdefault(cells[0], action)
+            for i, (row, col) in enumerate(cells):
+                x, y = self.cell_px[row][col]
+                
+                # Thick orange border for rope placement positions
+                highlight_rect = pygame.Rect(x + 2, y + 2, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
+                # Head (first cell) gets an inner highlight and a white dot
+                if i == 0:
+                    inner_rect = pygame.Rect(x + 5, y + 5, self.CELL_SIZE - 10, self.CELL_SIZE - 10)
+                    self.rope_highlights.append((highlight_rect, inner_rect, self.cell_center_px[row][col]))
+                else:
+                    self.rope_highlights.append((highlight_rect, None, None))
+        self.rope_highlights_source = self.available_rope_actions
     
     def draw_info_panel(self):
         """Draw the information panel"""
@@ -406,6 +551,18 @@ class RopesLaddersGUI:
         panel_x = self.BOARD_OFFSET_X + self.BOARD_SIZE * self.CELL_SIZE + 30
         panel_y = self.BOARD_OFFSET_Y
         
+        # The text only changes when a move is played or the game type changes
+        key = (self.game_state, self.human_vs_ai, self.ai_vs_ai_mode)
+        if key != self.info_panel_key:
+            self.info_panel_key = key
+            self.build_info_panel(panel_x, panel_y)
+        self.screen.blits(self.info_panel_lines, doreturn=False)
+        
+        # Action buttons for human players
+        self.draw_action_buttons(panel_x, self.info_panel_bottom + 30)
+    
+    def build_info_panel(self, panel_x: int, panel_y: int):
+        """Render the information panel's lines for the current state"""
         # Game info - only playing phase now
         # Determine if current player is human or AI
         is_human_turn = True
@@ -433,6 +590,9 @@ class RopesLaddersGUI:
             p1_label = "Player 1: (Human)"
             p2_label = "Player 2: (Human)"
         
+        p1_distance = self.game_state.manhattan_distance(self.game_state.player1_pos, self.game_state.prize_pos)
+        p2_distance = self.game_state.manhattan_distance(self.game_state.player2_pos, self.game_state.prize_pos)
+        
         info_lines = [
             f"Turn: {self.game_state.turn_count}",
             "",
@@ -441,29 +601,47 @@ class RopesLaddersGUI:
             p1_label,
             f"   Position: {self.game_state.player1_pos}",
             f"   Ropes left: {self.game_state.player1_rope_obstacles}",
-            f"   Distance: {self.game_state.manhattan_distance(self.game_state.player1_pos, self.game_state.prize_pos)}",
+            f"   Distance: {p1_distance}",
             "",
             p2_label,
             f"   Position: {self.game_state.player2_pos}",
             f"   Ropes left: {self.game_state.player2_rope_obstacles}",
-            f"   Distance: {self.game_state.manhattan_distance(self.game_state.player2_pos, self.game_state.prize_pos)}",
+            f"   Distance: {p2_distance}",
         ]
         
+        self.info_panel_lines = []
         for i, line in enumerate(info_lines):
             if line.strip():  # Non-empty lines
                 color = Colors.BLUE if "Player 1" in line else Colors.RED if "Player 2" in line else Colors.DARK_GRAY
                 if "Current Player" in line:
                     color = Colors.BLUE if self.game_state.current_player == Player.PLAYER1 else Colors.RED
                 
-                text_surface = self.small_font.render(line, True, color)
-                self.screen.blit(text_surface, (panel_x, panel_y + i * 25))
-        
-        # Action buttons for human players
-        if not self.ai_thinking:
-            self.draw_action_buttons(panel_x, panel_y + len(info_lines) * 25 + 30)
+                text_surface = self.render_text(line, color, self.small_font)
+                self.info_panel_lines.append((text_surface, (panel_x, panel_y + i * 25)))
+        self.info_panel_bottom = panel_y + len(info_lines) * 25
     
     def draw_action_buttons(self, x: int, y: int):
         """Draw action buttons for human players"""
+        # The panel only changes with the turn or the UI mode, so it is laid out once per change
+        key = (self.ai_thinking, self.human_vs_ai, self.ai_vs_ai_mode, self.ai_vs_ai_paused,
+               self.rope_placement_mode, self.game_state.turn_count, x, y)
+        if key != self.game_buttons_key:
+            self.game_buttons_key = key
+            self.build_game_buttons(x, y)
+        if self.game_mode == GameMode.GAME:
+            self.set_buttons(self.game_buttons)
+        
+        self.screen.blits(self.panel_labels, doreturn=False)
+        for button in self.panel_buttons:
+            self.draw_button(button)
+    
+    def build_game_buttons(self, x: int, y: int):
+        """Lay out the in-game instructions and buttons for the current turn"""
+        self.panel_labels = []
+        self.panel_buttons = []
+        self.mode_buttons = self.build_mode_buttons()
+        self.game_buttons = self.mode_buttons
+        
         # Don't show action buttons if AI is thinking
         if self.ai_thinking:
             return
@@ -479,117 +657,118 @@ class RopesLaddersGUI:
         if not is_human_turn:
             return
         
-        # Clear ALL buttons to avoid conflicts with menu buttons
-        self.buttons = []
-        
+        labels = self.panel_labels
+        buttons = self.panel_buttons
         button_width = 180
         button_height = 35
         
-        # Check if it's human's turn
-        is_human_turn = True
-        if self.ai_vs_ai_mode:
-            is_human_turn = False  # AI vs AI - no human players
-        elif self.human_vs_ai and self.game_state.current_player == Player.PLAYER2:
-            is_human_turn = False  # Human vs AI - Player 2 is AI
+        # Human turn instructions
+        labels.append((self.render_text("YOUR TURN:", Colors.GREEN, self.small_font), (x, y)))
+        y += 25
         
-        if is_human_turn:
-            # Human turn instructions
-            your_turn_text = self.small_font.render("YOUR TURN:", True, Colors.GREEN)
-            self.screen.blit(your_turn_text, (x, y))
-            y += 25
+        # Show rope placement mode instructions
+        if self.rope_placement_mode:
+            labels.append((self.render_text("Placing rope:", Colors.ORANGE, self.small_font), (x, y)))
+            y += 20
             
-            # Show rope placement mode instructions
-            if self.rope_placement_mode:
-                rope_mode_text = self.small_font.render("Placing rope:", True, Colors.ORANGE)
-                self.screen.blit(rope_mode_text, (x, y))
+            labels.append((self.render_text("Click orange cells to place rope", Colors.DARK_GRAY, self.small_font), (x, y)))
+            y += 20
+            
+            labels.append((self.render_text("(Click anywhere else to cancel)", Colors.GRAY, self.small_font), (x, y)))
+            y += 30
+        
+        else:
+            # Move buttons
+            move_actions = [action for action in self.possible_moves if action.type == ActionType.MOVE]
+            if move_actions:
+                labels.append((self.render_text("Click green cells to move", Colors.DARK_GRAY, self.small_font), (x, y)))
                 y += 20
+        
+            # Rope placement buttons
+            rope_actions = [action for action in self.possible_moves if action.type == ActionType.PLACE_ROPE_OBSTACLE]
+            if rope_actions:
+                labels.append((self.render_text("Place Ropes:", Colors.DARK_GRAY, self.small_font), (x, y)))
+                y += 25
                 
-                instruction_text = self.small_font.render("Click orange cells to place rope", True, Colors.DARK_GRAY)
-                self.screen.blit(instruction_text, (x, y))
-                y += 20
+                # Group actions by direction
+                directions = {}
+                for action in rope_actions:
+                    direction = action.direction
+                    if direction not in directions:
+                        directions[direction] = []
+                    directions[direction].append(action)
                 
-                cancel_text = self.small_font.render("(Click anywhere else to cancel)", True, Colors.GRAY)
-                self.screen.blit(cancel_text, (x, y))
-                y += 30
-            
-            else:
-                # Move buttons
-                move_actions = [action for action in self.possible_moves if action['type'] == ActionType.MOVE]
-                if move_actions:
-                    move_text = self.small_font.render("Click green cells to move", True, Colors.DARK_GRAY)
-                    self.screen.blit(move_text, (x, y))
-                    y += 20
-            
-                # Rope placement buttons
-                rope_actions = [action for action in self.possible_moves if action['type'] == ActionType.PLACE_ROPE_OBSTACLE]
-                if rope_actions:
-                    rope_header = self.small_font.render("Place Ropes:", True, Colors.DARK_GRAY)
-                    self.screen.blit(rope_header, (x, y))
-                    y += 25
-                    
-                    # Group actions by direction
-                    directions = {}
-                    for action in rope_actions:
-                        direction = action.get('direction', 'unknown')
-                        if direction not in directions:
-                            directions[direction] = []
-                        directions[direction].append(action)
+                # Create buttons for each direction
+                for direction, actions in directions.items():
+                    if direction == 'down':
+                        button_text = "Down"
+                        button_color = Colors.PURPLE
+                    elif direction == 'diagonal_right':
+                        button_text = "Diag-Right"
+                        button_color = Colors.ORANGE
+                    elif direction == 'diagonal_left':
+                        button_text = "Diag-Left"
+                        button_color = Colors.YELLOW
+                    else:
+                        button_text = direction.title()
+                        button_color = Colors.GRAY
                     
-                    # Create buttons for each direction
-                    for direction, actions in directions.items():
-                        if direction == 'down':
-                            button_text = "Down"
-                            button_color = Colors.PURPLE
-                        elif direction == 'diagonal_right':
-                            button_text = "Diag-Right"
-                            button_color = Colors.ORANGE
-                        elif direction == 'diagonal_left':
-                            button_text = "Diag-Left"
-                            button_color = Colors.YELLOW
-                        else:
-                            button_text = direction.title()
-                            button_color = Colors.GRAY
-                        
-                        rope_button = self.create_button(x, y, button_width, button_height - 5, 
-                                                       button_text, 
-                                                       f"rope_{direction}", button_color)
-                        rope_button['is_action_button'] = True
-                        rope_button['rope_actions'] = actions
-                        self.buttons.append(rope_button)
-                        self.draw_button(rope_button)
-                        y += button_height + 5
-                    
-                    rope_info = self.small_font.render("(Head = white dot = danger!)", True, Colors.RED)
-                    self.screen.blit(rope_info, (x, y))
-                    y += 30
-        else:
-            # AI turn indicator
-            ai_text = self.small_font.render("AI is thinking...", True, Colors.PURPLE)
-            self.screen.blit(ai_text, (x, y))
-            y += 40
+                    rope_button = self.create_button(x, y, button_width, button_height - 5, 
+                                                   button_text, 
+                                                   f"rope_{direction}", button_color)
+                    rope_button['is_action_button'] = True
+                    rope_button['rope_actions'] = actions
+                    buttons.append(rope_button)
+                    y += button_height + 5
+                
+                labels.append((self.render_text("(Head = white dot = danger!)", Colors.RED, self.small_font), (x, y)))
+                y += 30
         
         # Back to menu button
         menu_button = self.create_button(x, y + 50, button_width, button_height, 
                                        "Back to Menu", "back_to_menu", Colors.GRAY)
         menu_button['is_action_button'] = True
-        self.buttons.append(menu_button)
-        self.draw_button(menu_button)
+        buttons.append(menu_button)
         
         # Exit button
         exit_button = self.create_button(x, y + 100, button_width, button_height, 
                                        "Exit Game", "exit", Colors.RED)
         exit_button['is_action_button'] = True
-        self.buttons.append(exit_button)
-        self.draw_button(exit_button)
+        buttons.append(exit_button)
+        
+        self.game_buttons = buttons + self.mode_buttons
+    
+    def set_buttons(self, buttons: List[Dict]):
+        """Make buttons the clickable set, moving hover to whichever of them is under the pointer"""
+        if buttons is self.buttons:
+            return
+        if self.hovered_button is not None:
+            self.hovered_button['hover'] = False
+            self.hovered_button = None
+        self.buttons = buttons
+        self.button_bands = {}
+        for button in buttons:
+            rect = button['rect']
+            for band in range(rect.top // self.BUTTON_BAND_HEIGHT, (rect.bottom - 1) // self.BUTTON_BAND_HEIGHT + 1):
+                self.button_bands.setdefault(band, []).append(button)
+        self.update_hover(pygame.mouse.get_pos())
+    
+    def button_at(self, pos: Tuple[int, int]) -> Optional[Dict]:
+        """Find the clickable button under pos, if any"""
+        # Buttons don't overlap, so the first hit is the only one
+        for button in self.button_bands.get(pos[1] // self.BUTTON_BAND_HEIGHT, ()):
+            if button['rect'].collidepoint(pos):
+                return button
+        return None
     
     def draw_ai_thinking(self):
         """Draw AI thinking indicator"""
         if self.ai_thinking:
             if self.ai_vs_ai_mode:
                 # Only show a generic message, no countdown
-                thinking_text = self.font.render("AI is thinking...", True, Colors.PURPLE)
+                thinking_text = self.render_text("AI is thinking...", Colors.PURPLE, self.font)
             else:
-                thinking_text = self.font.render("AI is thinking...", True, Colors.PURPLE)
+                thinking_text = self.render_text("AI is thinking...", Colors.PURPLE, self.font)
             
             thinking_rect = thinking_text.get_rect(center=(self.SCREEN_WIDTH // 2, 50))
             
@@ -602,27 +781,31 @@ class RopesLaddersGUI:
     
     def draw_game_mode_indicator(self):
         """Draw game mode indicator and stop/resume/exit buttons for AI vs AI"""
+        if self.ai_vs_ai_mode:
+            mode_text = self.render_text("AI vs AI Mode - Watch the AIs compete!", Colors.DARK_GRAY, self.small_font)
+            mode_rect = mode_text.get_rect(center=(self.SCREEN_WIDTH // 2, 25))
+            self.screen.blit(mode_text, mode_rect)
+        for button in self.mode_buttons:
+            self.draw_button(button)
+    
+    def build_mode_buttons(self) -> List[Dict]:
+        """Create the Exit button and, in AI vs AI, the Stop/Resume button"""
         # Always show Exit button in top right
         exit_button = self.create_button(self.SCREEN_WIDTH - 130, 15, 100, 35, "Exit", "exit", Colors.RED)
         exit_button['is_action_button'] = True
-        self.buttons.append(exit_button)
-        self.draw_button(exit_button)
+        buttons = [exit_button]
         if self.ai_vs_ai_mode:
-            mode_text = self.small_font.render("AI vs AI Mode - Watch the AIs compete!", True, Colors.DARK_GRAY)
-            mode_rect = mode_text.get_rect(center=(self.SCREEN_WIDTH // 2, 25))
-            self.screen.blit(mode_text, mode_rect)
             if self.ai_vs_ai_paused:
-                # Draw Resume button
+                # Resume button
                 resume_button = self.create_button(self.SCREEN_WIDTH - 250, 15, 100, 35, "Resume", "stop_ai", Colors.GREEN)
                 resume_button['is_action_button'] = True
-                self.buttons.append(resume_button)
-                self.draw_button(resume_button)
+                buttons.append(resume_button)
             else:
-                # Draw Stop button at top right (next to Exit)
+                # Stop button at top right (next to Exit)
                 stop_button = self.create_button(self.SCREEN_WIDTH - 250, 15, 100, 35, "Stop", "stop_ai", Colors.RED)
                 stop_button['is_action_button'] = True
-                self.buttons.append(stop_button)
-                self.draw_button(stop_button)
+                buttons.append(stop_button)
+        return buttons
 
     # Add a paused state to the GUI
     def pause_ai_vs_ai(self):
@@ -638,20 +821,52 @@ class RopesLaddersGUI:
     def draw_game_over(self):
         """Draw game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Game over panel
         panel_width = 400
         panel_height = 400
         panel_x = (self.SCREEN_WIDTH - panel_width) // 2
         panel_y = (self.SCREEN_HEIGHT - panel_height) // 2
+        center_x = panel_x + panel_width // 2
+        
+        # Panel, winner and statistics are fixed once the game is over
+        if self.game_over_panel_source is not self.game_state:
+            self.game_over_panel = self.build_game_over_panel(panel_width, panel_height)
+            self.game_over_panel_source = self.game_state
+        self.screen.blit(self.game_over_panel, (panel_x, panel_y))
+        
+        # Buttons, created on the first game over
+        if self.game_over_buttons is None:
+            button_width = 120
+            button_height = 40
+            row1_y = panel_y + panel_height - 100
+            row2_y = panel_y + panel_height - 50
+            
+            # Row 1: Play Again and Main Menu
+            play_again_button = self.create_button(panel_x + 30, row1_y, 
+                                                 button_width, button_height, "Play Again", "play_again")
+            menu_button = self.create_button(panel_x + panel_width - 150, row1_y, 
+                                           button_width, button_height, "Main Menu", "back_to_menu")
+            
+            # Row 2: Exit button (centered)
+            exit_button = self.create_button(center_x - button_width // 2, row2_y, 
+                                           button_width, button_height, "Exit Game", "exit", Colors.RED)
+            
+            self.game_over_buttons = [play_again_button, menu_button, exit_button]
+        self.set_buttons(self.game_over_buttons)
+        
+        for button in self.buttons:
+            self.draw_button(button)
+    
+    def build_game_over_panel(self, panel_width: int, panel_height: int) -> pygame.Surface:
+        """Render the game over panel's background, winner and statistics for the finished game"""
+        surface = pygame.Surface((panel_width, panel_height)).convert()
+        center_x = panel_width // 2
         
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, Colors.WHITE, panel_rect)
-        pygame.draw.rect(self.screen, Colors.DARK_GRAY, panel_rect, 3)
+        panel_rect = surface.get_rect()
+        pygame.draw.rect(surface, Colors.WHITE, panel_rect)
+        pygame.draw.rect(surface, Colors.DARK_GRAY, panel_rect, 3)
         
         # Winner announcement
         winner = self.game_state.get_winner()
@@ -662,51 +877,39 @@ class RopesLaddersGUI:
             winner_text = "It's a Draw!"
             color = Colors.GRAY
         
-        winner_surface = self.title_font.render(winner_text, True, color)
-        winner_rect = winner_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 80))
-        self.screen.blit(winner_surface, winner_rect)
+        winner_surface = self.render_text(winner_text, color, self.title_font)
+        winner_rect = winner_surface.get_rect(center=(center_x, 80))
+        surface.blit(winner_surface, winner_rect)
         
         # Game statistics
-        stats_y = panel_y + 150
+        stats_y = 150
         stats = [
             f"Total turns: {self.game_state.turn_count}",
             f"Rope obstacles placed: {len(self.game_state.rope_obstacles)}"
         ]
         
+        stat_blits = []
         for i, stat in enumerate(stats):
-            stat_surface = self.font.render(stat, True, Colors.DARK_GRAY)
-            stat_rect = stat_surface.get_rect(center=(panel_x + panel_width // 2, stats_y + i * 35))
-            self.screen.blit(stat_surface, stat_rect)
-        
-        # Buttons
-        self.buttons = []
-        button_width = 120
-        button_height = 40
-        
-        # Row 1: Play Again and Main Menu
-        play_again_button = self.create_button(panel_x + 30, panel_y + panel_height - 100, 
-                                             button_width, button_height, "Play Again", "play_again")
-        menu_button = self.create_button(panel_x + panel_width - 150, panel_y + panel_height - 100, 
-                                       button_width, button_height, "Main Menu", "back_to_menu")
-        
-        # Row 2: Exit button (centered)
-        exit_button = self.create_button(panel_x + (panel_width - button_width) // 2, panel_y + panel_height - 50, 
-                                       button_width, button_height, "Exit Game", "exit", Colors.RED)
-        
-        self.buttons.extend([play_again_button, menu_button, exit_button])
-        
-        for button in self.buttons:
-            self.draw_button(button)
+            stat_surface = self.render_text(stat, Colors.DARK_GRAY, self.font)
+            stat_blits.append((stat_surface, stat_surface.get_rect(center=(center_x, stats_y + i * 35))))
+        surface.blits(stat_blits, doreturn=False)
+        return surface
     
     def start_new_game(self):
         """Start a new game"""
         self.game_state = GameState(self.BOARD_SIZE, max_ropes=3, verbose=False)
-        self.possible_moves = self.game_state.get_possible_actions()
         self.game_mode = GameMode.GAME
         self.cell_size = self.CELL_SIZE
         
         # Clear AI agent cache and position history for fresh start
+        self.stop_ai_search()
+        self.update_possible_moves()
         self.ai_agent.clear_cache()
+        self.rope_surfaces.clear()
+        self.game_buttons_key = None
+        
+        # The AI may have the first move
+        self.check_ai_turn()
     
 
     
@@ -715,29 +918,30 @@ class RopesLaddersGUI:
         if not self.game_state or self.ai_thinking:
             return
         
-        mouse_x, mouse_y = pos
-        
         # Check if click is within board
-        if (mouse_x < self.BOARD_OFFSET_X or mouse_x > self.BOARD_OFFSET_X + self.BOARD_SIZE * self.CELL_SIZE or
-            mouse_y < self.BOARD_OFFSET_Y or mouse_y > self.BOARD_OFFSET_Y + self.BOARD_SIZE * self.CELL_SIZE):
+        dx = pos[0] - self.BOARD_OFFSET_X
+        dy = pos[1] - self.BOARD_OFFSET_Y
+        if not (0 <= dx < self.board_span and 0 <= dy < self.board_span):
             return
         
         # Convert to board coordinates
-        col = (mouse_x - self.BOARD_OFFSET_X) // self.CELL_SIZE
-        row = (mouse_y - self.BOARD_OFFSET_Y) // self.CELL_SIZE
+        col = dx // self.CELL_SIZE
+        row = dy // self.CELL_SIZE
         target_pos = (row, col)
         
         # Handle rope placement mode
         if self.rope_placement_mode:
             # Find rope action that starts at clicked position
-            for action in self.available_rope_actions:
-                if action['segment'][0] == target_pos:  # Check if head of rope is at clicked position
-                    self.execute_action(action)
-                    # Exit rope placement mode
-                    self.rope_placement_mode = False
-                    self.available_rope_actions = []
-                    print(f"Placed rope at {target_pos}")
-                    return
+            if self.rope_highlights_source is not self.available_rope_actions:
+                self.build_rope_highlights()
+            action = self.rope_by_head.get(target_pos)
+            if action is not None:
+                self.execute_action(action)
+                # Exit rope placement mode
+                self.rope_placement_mode = False
+                self.available_rope_actions = []
+                print(f"Placed rope at {target_pos}")
+                return
             
             # If no valid rope placement found, exit rope placement mode
             self.rope_placement_mode = False
@@ -746,45 +950,56 @@ class RopesLaddersGUI:
             return
         
         # Handle regular movement
-        move_action = None
-        for action in self.possible_moves:
-            if action['type'] == ActionType.MOVE and action['position'] == target_pos:
-                move_action = action
-                break
+        if self.move_highlights_source is not self.possible_moves:
+            self.build_move_highlights()
+        move_action = self.move_by_pos.get(target_pos)
         
         if move_action:
             self.execute_action(move_action)
     
-    def execute_action(self, action: Dict):
+    def execute_action(self, action: Action):
         """Execute a game action"""
         self.game_state = self.game_state.apply_action(action)
-        self.possible_moves = self.game_state.get_possible_actions()
+        self.update_possible_moves()
         
         # Update game mode - always in playing phase now
         self.game_mode = GameMode.GAME
         
         # Check if game is over
+        # A move only changes the board and the info panel, unless it ends the game
         if self.game_state.is_game_over():
             self.game_mode = GameMode.GAME_OVER
+            self.request_redraw()
+        else:
+            self.request_redraw(self.board_rect)
+            self.request_redraw(self.panel_rect)
         
         # Start AI turn if needed
         self.check_ai_turn()
     
+    def is_ai_turn(self) -> bool:
+        """Check whether the current player is controlled by the AI"""
+        if self.ai_vs_ai_mode:
+            return True
+        return self.human_vs_ai and self.game_state.current_player == Player.PLAYER2
+    
+    def update_possible_moves(self):
+        """Refresh the actions offered to the player on turn"""
+        # The AI generates its own actions during search, so only human turns need them
+        if self.is_ai_turn():
+            self.possible_moves = []
+        else:
+            self.possible_moves = self.game_state.get_possible_actions()
+    
     def check_ai_turn(self):
         """Check if it's AI's turn and start AI thinking"""
         if self.game_state.is_game_over():
             return
         
-        is_ai_turn = False
-        
-        if self.ai_vs_ai_mode:
-            is_ai_turn = True
-        elif self.human_vs_ai and self.game_state.current_player == Player.PLAYER2:
-            is_ai_turn = True
-        
         # Only start AI thinking if it's actually an AI turn and we're not already thinking
-        if is_ai_turn and not self.ai_thinking:
+        if self.is_ai_turn() and not self.ai_thinking:
             self.ai_thinking = True
+            self.request_redraw()
             # Reset timers for new AI turn
             self.last_ai_move_time = 0
             # AI will think in the next frame to keep UI responsive
@@ -798,31 +1013,69 @@ class RopesLaddersGUI:
         if self.ai_vs_ai_mode and self.ai_vs_ai_paused:
             return
         
-        # Add delay for human vs AI mode so human can see what's happening
-        if self.human_vs_ai:
-            self.last_ai_move_time += dt
-            if self.last_ai_move_time < self.ai_auto_delay:
-                return  # Still waiting
-            self.last_ai_move_time = 0
+        # The delay counts from the start of the turn, so the search time is part of it
+        self.last_ai_move_time += dt
         
-        # Add delay for AI vs AI mode so user can watch the moves
-        elif self.ai_vs_ai_mode:
-            self.last_ai_move_time += dt
-            if self.last_ai_move_time < self.ai_auto_delay:
-                return  # Still waiting
-            # Reset timer for next turn
-            self.last_ai_move_time = 0
-        
-        # Get AI move
-        action = self.ai_agent.get_best_move(self.game_state)
+        # Search in the background, then hold the move until the delay has passed
+        if self.pending_ai_action is None:
+            if self.ai_thread is None:
+                self.start_ai_search()
+                return
+            try:
+                result = self.ai_results.get_nowait()
+            except queue.Empty:
+                return  # Still searching
+            self.ai_thread = None
+            if isinstance(result, Exception):
+                raise result  # The search failed; surface it here instead of thinking forever
+            self.pending_ai_action = result
+        
+        # Add delay so players can see what's happening and watch the moves
+        if self.last_ai_move_time < self.ai_auto_delay:
+            return  # Still waiting
+        # Reset timer for next turn
+        self.last_ai_move_time = 0
         
-        # Execute the action
+        # Execute the action; this starts the next AI turn if there is one
+        action = self.pending_ai_action
+        self.pending_ai_action = None
+        self.ai_thinking = False
         self.execute_action(action)
-        
+        self.request_redraw()
+    
+    def start_ai_search(self):
+        """Search for the AI's move on a worker thread"""
+        # get_best_move() searches its own clone, and the GUI only ever replaces
+        # game_state, so the worker can be handed the current state as is
+        state = self.game_state
+        results = self.ai_results
+        # Each search gets its own cancel event, so a stop can't be lost to a search that hasn't started yet
+        cancel = self.ai_cancel = threading.Event()
+        
+        def search():
+            # Post failures too, so process_ai_turn() can raise them on the main thread
+            try:
+                result = self.ai_agent.get_best_move(state, cancel=cancel)
+            except Exception as e:
+                result = e
+            results.put(result)
+        
+        self.ai_thread = threading.Thread(target=search, daemon=True)
+        self.ai_thread.start()
+    
+    def stop_ai_search(self):
+        """Abandon the AI's current turn, waiting for a running search to wind down"""
+        if self.ai_thread is not None:
+            self.ai_cancel.set()
+            self.ai_thread.join()
+            self.ai_thread = None
+            self.ai_results = queue.Queue()  # Drop the abandoned search's move
+        self.pending_ai_action = None
         self.ai_thinking = False
     
     def handle_events(self):
         """Handle pygame events"""
+        motion_pos = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -832,7 +1085,15 @@ class RopesLaddersGUI:
                     self.handle_mouse_click(event.pos)
             
             elif event.type == pygame.MOUSEMOTION:
-                self.handle_mouse_motion(event.pos)
+                motion_pos = event.pos
+                continue
+            
+            # Clicks and expose events may change or damage the whole screen
+            self.request_redraw()
+        
+        # Only the latest pointer position matters for hover
+        if motion_pos is not None:
+            self.handle_mouse_motion(motion_pos)
         
         return True
     
@@ -840,11 +1101,10 @@ class RopesLaddersGUI:
         """Handle mouse clicks"""
         
         # Check button clicks
-        for button in self.buttons:
-            if button['rect'].collidepoint(pos):
-                
-                self.handle_button_click(button['action'])
-                return
+        button = self.button_at(pos)
+        if button is not None:
+            self.handle_button_click(button['action'])
+            return
         
         # Handle board clicks in game mode
         if self.game_mode == GameMode.GAME:
@@ -852,8 +1112,28 @@ class RopesLaddersGUI:
     
     def handle_mouse_motion(self, pos: Tuple[int, int]):
         """Handle mouse motion for hover effects"""
-        for button in self.buttons:
-            button['hover'] = button['rect'].collidepoint(pos)
+        previous = self.hovered_button
+        if self.update_hover(pos):
+            # Only the buttons that gained or lost hover change
+            for button in (previous, self.hovered_button):
+                if button is not None:
+                    self.request_redraw(button['rect'])
+    
+    def update_hover(self, pos: Tuple[int, int]) -> bool:
+        """Mark the button under pos as hovered; returns whether the hover changed"""
+        hovered = self.hovered_button
+        if hovered is not None:
+            if hovered['rect'].collidepoint(pos):
+                return False
+            hovered['hover'] = False
+            self.hovered_button = None
+        
+        button = self.button_at(pos)
+        if button is not None:
+            button['hover'] = True
+            self.hovered_button = button
+            return True
+        return hovered is not None
     
     def handle_button_click(self, action: str):
         """Handle button clicks"""
@@ -874,6 +1154,7 @@ class RopesLaddersGUI:
             self.start_new_game()
         
         elif action == "back_to_menu":
+            self.stop_ai_search()
             self.game_mode = GameMode.MENU
         
         elif action == "play_again":
@@ -907,16 +1188,14 @@ class RopesLaddersGUI:
 
     def update(self):
         """Update game state"""
-        # Calculate delta time
-        dt = pygame.time.get_ticks() / 1000.0  # Convert to seconds
+        # Calculate delta time since the previous update
+        now = pygame.time.get_ticks()
+        dt = (now - self.last_tick) / 1000.0  # Convert to seconds
+        self.last_tick = now
         
-        # Process AI turn if needed
+        # Process AI turn if needed (AI turns are started by execute_action and start_new_game)
         if self.ai_thinking:
             self.process_ai_turn(dt)
-        
-        # Check for new AI turns
-        if self.game_mode == GameMode.GAME:
-            self.check_ai_turn()
     
     def draw(self):
         """Draw everything"""
@@ -936,7 +1215,11 @@ class RopesLaddersGUI:
             self.draw_info_panel()
             self.draw_game_over()
         
-        pygame.display.flip()
+        if self.dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty_rects)
+        self.dirty_rects = []
     
     def run(self):
         """Main game loop"""
@@ -945,8 +1228,10 @@ class RopesLaddersGUI:
         while running:
             running = self.handle_events()
             self.update()
-            self.draw()
-            pygame.time.delay(10) # Reduced delay for smoother updates
+            if self.needs_redraw:
+                self.needs_redraw = False
+                self.draw()
+            self.clock.tick(self.FPS)
         
         pygame.quit()
         sys.exit()